@@ -1,5 +1,5 @@
 """Configuration package for Upwork Job Sniper."""
 
-from .settings import settings
+from .settings import create_dirs, get_settings, settings
 
-__all__ = ["settings"]
+__all__ = ["create_dirs", "get_settings", "settings"]
@@ -1,9 +1,10 @@
 """Application settings and configuration."""
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional, cast
 
-from pydantic import Field, SecretStr, validator
+from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -25,6 +26,14 @@ class Settings(BaseSettings):
     # API Endpoints
     UPWORK_GRAPHQL_ENDPOINT: str = "https://api.upwork.com/graphql"
     
+    # How long (seconds) API results are reused before being fetched again
+    UPWORK_ORGANIZATION_CACHE_TTL: float = 3600
+    UPWORK_JOB_DETAILS_CACHE_TTL: float = 300
+    
+    # Keep-alive connection pool of the shared Upwork HTTP session
+    UPWORK_HTTP_POOL_CONNECTIONS: int = 20
+    UPWORK_HTTP_POOL_MAXSIZE: int = 20
+    
     # OpenAI API settings
     OPENAI_API_KEY: SecretStr
     OPENAI_MODEL: str = Field(default="gpt-4o-mini")
@@ -40,10 +49,17 @@ class Settings(BaseSettings):
     
     # Search parameters
     SEARCH_QUERY: str = "wordpress"
+    # Optional list of queries searched concurrently; falls back to SEARCH_QUERY
+    SEARCH_QUERIES: List[str] = Field(default_factory=list)
     HOURLY_RATE_MIN: int = 30
     BUDGET_MIN: int = 500
     SEARCH_LIMIT: int = 10
     
+    # Polling interval (seconds); grows by SEARCH_BACKOFF_FACTOR while idle
+    SEARCH_MIN_INTERVAL: float = 600
+    SEARCH_MAX_INTERVAL: float = 3600
+    SEARCH_BACKOFF_FACTOR: float = 1.5
+    
     # AI analysis settings
     ENABLE_AI_ANALYSIS: bool = Field(default=True)
     MIN_NOTIFICATION_SCORE: int = Field(default=7)
@@ -61,16 +77,26 @@ class Settings(BaseSettings):
         extra="ignore"
     )
 
-    @validator("DATA_DIR", "LOGS_DIR", pre=True)
-    def create_dirs(cls, v: Path) -> Path:
-        """Create directories if they don't exist."""
-        v.mkdir(parents=True, exist_ok=True)
-        return v
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance, building it on first use."""
+    return Settings()
+
+
+def create_dirs(config: Settings) -> None:
+    """Create the data and logs directories; called once at startup."""
+    os.makedirs(config.DATA_DIR, exist_ok=True)
+    os.makedirs(config.LOGS_DIR, exist_ok=True)
+
+
+class _LazySettings:
+    """Proxy that defers building Settings until an attribute is first read."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
 
-# Create settings instance
-settings = Settings()
 
-# Create necessary directories
-settings.DATA_DIR.mkdir(parents=True, exist_ok=True)
-settings.LOGS_DIR.mkdir(parents=True, exist_ok=True)
+# Lazy settings proxy (kept for backwards compatibility), typed as Settings
+# so attribute types are still checked
+settings: Settings = cast(Settings, _LazySettings())
@@ -9,57 +9,64 @@ Note: Requires OPENAI_API_KEY to be set in environment variables.
 import sys
 from pathlib import Path
 
+import orjson
+
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.ai.job_analyzer import JobAnalyzer, JobAnalysis
-from config.settings import settings
+from config.settings import get_settings
+
+# Sample job pre-serialized once at import; decoded fresh for each caller
+_SAMPLE_JOB_JSON = orjson.dumps({
+    "id": "demo_job_123",
+    "title": "WordPress Developer Needed - Custom Plugin Development",
+    "description": """
+    We are looking for an experienced WordPress developer to create a custom plugin 
+    for our e-commerce website. The plugin should integrate with WooCommerce and 
+    provide advanced inventory management features.
+    
+    Requirements:
+    - 3+ years WordPress development experience
+    - Strong PHP and MySQL skills
+    - Experience with WooCommerce
+    - Knowledge of REST APIs
+    - Clean, well-documented code
+    
+    This is a fixed-price project with potential for ongoing work.
+    """,
+    "hourlyBudgetMin": {"displayValue": "$50"},
+    "hourlyBudgetMax": {"displayValue": "$75"},
+    "amount": {"displayValue": "$2,500"},
+    "client": {
+        "totalReviews": 45,
+        "totalSpent": {"displayValue": "$25,000"},
+        "totalHires": 28,
+        "verificationStatus": "VERIFIED",
+        "totalFeedback": "4.8"
+    },
+    "skills": [
+        {"name": "WordPress"},
+        {"name": "PHP"},
+        {"name": "WooCommerce"},
+        {"name": "MySQL"},
+        {"name": "REST API"}
+    ],
+    "createdDateTime": "2024-01-15T10:30:00Z",
+    "totalApplicants": 8
+})
 
 def create_sample_job():
     """Create a sample job for testing."""
-    return {
-        "id": "demo_job_123",
-        "title": "WordPress Developer Needed - Custom Plugin Development",
-        "description": """
-        We are looking for an experienced WordPress developer to create a custom plugin 
-        for our e-commerce website. The plugin should integrate with WooCommerce and 
-        provide advanced inventory management features.
-        
-        Requirements:
-        - 3+ years WordPress development experience
-        - Strong PHP and MySQL skills
-        - Experience with WooCommerce
-        - Knowledge of REST APIs
-        - Clean, well-documented code
-        
-        This is a fixed-price project with potential for ongoing work.
-        """,
-        "hourlyBudgetMin": {"displayValue": "$50"},
-        "hourlyBudgetMax": {"displayValue": "$75"},
-        "amount": {"displayValue": "$2,500"},
-        "client": {
-            "totalReviews": 45,
-            "totalSpent": {"displayValue": "$25,000"},
-            "totalHires": 28,
-            "verificationStatus": "VERIFIED",
-            "totalFeedback": "4.8"
-        },
-        "skills": [
-            {"name": "WordPress"},
-            {"name": "PHP"},
-            {"name": "WooCommerce"},
-            {"name": "MySQL"},
-            {"name": "REST API"}
-        ],
-        "createdDateTime": "2024-01-15T10:30:00Z",
-        "totalApplicants": 8
-    }
+    return orjson.loads(_SAMPLE_JOB_JSON)
 
 def demo_ai_analysis():
     """Demonstrate AI job analysis."""
     print("🤖 AI Job Analysis Demo")
     print("=" * 40)
     
+    settings = get_settings()
+    
     # Check if AI is enabled
     if not settings.ENABLE_AI_ANALYSIS:
         print("❌ AI analysis is disabled. Set ENABLE_AI_ANALYSIS=true to enable.")
@@ -7,69 +7,101 @@ It initializes the application and starts the job monitoring process.
 """
 import asyncio
 import logging
+import logging.handlers
+import os
 import signal
-import sys
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Any
 
 import orjson
-from dotenv import load_dotenv
 
-# Add project root to path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from config import settings
+from config import create_dirs, settings
 from src.api.upwork_graphql import UpworkGraphQLClient, UpworkAuthenticationError, UpworkAPIError
-from src.notifications import PushoverNotifier
-from src.ai import JobAnalyzer
+from src.notifications import NotificationWorker, PushoverNotifier
+from src.ai import JobAnalyzer, JobAnalysis, JobView
 
-# Configure logging
-logging.basicConfig(
-    level=settings.LOG_LEVEL,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(settings.LOGS_DIR / "upwork_sniper.log")
-    ]
-)
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
-
 class JobTracker:
-    """Tracks seen jobs to avoid duplicates."""
+    """Tracks seen jobs to avoid duplicates.
+    
+    Seen job IDs are kept in an append-only JSON Lines journal
+    (``{"id": ...}`` per line) so that marking a job costs a single small
+    write instead of rewriting every ID. Appended records are buffered and
+    persisted once per search cycle via flush(). The journal is compacted
+    atomically once it holds more than COMPACT_RATIO records per live ID.
+    At most MAX_SEEN_JOBS IDs are kept; the least recently seen are
+    evicted first.
+    """
+    
+    # Compact the journal once it holds this many records per seen job ID
+    COMPACT_RATIO = 2
+    # Upwork postings age out of search results long before this many new ones appear
+    MAX_SEEN_JOBS = 50_000
     
     def __init__(self, data_dir: Path):
         """Initialize the job tracker."""
         self.data_dir = data_dir
         self.data_dir.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
-        self.seen_jobs_file = data_dir / "seen_jobs.json"
-        self.seen_job_ids: Set[str] = set()
+        self.seen_jobs_file = data_dir / "seen_jobs.jsonl"
+        self.legacy_seen_jobs_file = data_dir / "seen_jobs.json"
+        # Ordered by when each ID was last seen: membership lookups,
+        # oldest-first iteration for compaction and O(1) LRU eviction
+        self.seen_job_ids: "OrderedDict[str, None]" = OrderedDict()
+        self._journal_records = 0
+        self._pending_writes = 0
         self._load_seen_jobs()
+        self._evict_oldest()
+        
+        if self.legacy_seen_jobs_file.exists() or self._needs_compaction():
+            self._save_seen_jobs()
+        self._journal = open(self.seen_jobs_file, 'ab')
         logger.info(f"JobTracker initialized with {len(self.seen_job_ids)} seen job(s)")
     
     def _load_seen_jobs(self) -> None:
-        """Load seen job IDs from file."""
+        """Load seen job IDs from the journal, migrating the legacy JSON file if present."""
+        if self.legacy_seen_jobs_file.exists():
+            try:
+                with open(self.legacy_seen_jobs_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+                    loaded_ids = data.get("seen_job_ids", [])
+                    if not isinstance(loaded_ids, list):
+                        raise ValueError("Invalid format in seen_jobs.json")
+                        
+                    self.seen_job_ids.update(dict.fromkeys(loaded_ids))
+                    logger.info(f"Migrated {len(loaded_ids)} seen job IDs from {self.legacy_seen_jobs_file}")
+                    
+            except orjson.JSONDecodeError as e:
+                logger.error(f"Error decoding JSON from {self.legacy_seen_jobs_file}: {e}")
+            except Exception as e:
+                logger.error(f"Failed to load legacy seen jobs: {e}", exc_info=True)
+        
         if not self.seen_jobs_file.exists():
-            logger.info("No existing seen jobs file found, starting fresh")
+            logger.info("No existing seen jobs journal found, starting fresh")
             return
             
         try:
+            corrupt = 0
             with open(self.seen_jobs_file, 'rb') as f:
-                data = orjson.loads(f.read())
-                loaded_ids = data.get("seen_job_ids", [])
-                if not isinstance(loaded_ids, list):
-                    raise ValueError("Invalid format in seen_jobs.json")
-                    
-                self.seen_job_ids = set(loaded_ids)
-                logger.info(f"Successfully loaded {len(self.seen_job_ids)} seen job IDs from {self.seen_jobs_file}")
+                for line in f:
+                    if not line.strip():
+                        continue
+                    self._journal_records += 1
+                    try:
+                        job_id = orjson.loads(line)["id"]
+                        self.seen_job_ids[job_id] = None
+                        # A later record means the ID was seen again
+                        self.seen_job_ids.move_to_end(job_id)
+                    except (orjson.JSONDecodeError, KeyError, TypeError):
+                        corrupt += 1
+            if corrupt:
+                logger.warning(f"Skipped {corrupt} corrupt record(s) in {self.seen_jobs_file}")
+            logger.info(f"Successfully loaded {len(self.seen_job_ids)} seen job IDs from {self.seen_jobs_file}")
                 
-        except orjson.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON from {self.seen_jobs_file}: {e}")
-            # Keep existing seen_job_ids (empty set if first run)
         except Exception as e:
             logger.error(f"Failed to load seen jobs: {e}", exc_info=True)
     
@@ -87,38 +119,81 @@ class JobTracker:
         return is_new
     
     def mark_job_seen(self, job_id: str) -> None:
-        """Mark a job ID as seen and persist to disk."""
+        """Mark a job ID as seen; persisted on the next flush().
+        
+        Marking an ID again makes it the most recently seen, so it is
+        evicted last.
+        """
         if not job_id:
             logger.warning("Attempted to mark empty job ID as seen")
             return
             
         if job_id in self.seen_job_ids:
             logger.debug(f"Job {job_id} was already marked as seen")
+            self.seen_job_ids.move_to_end(job_id)
+        else:
+            logger.info(f"Marking job {job_id} as seen")
+            self.seen_job_ids[job_id] = None
+            self._evict_oldest()
+        try:
+            self._journal.write(orjson.dumps({"id": job_id}, option=orjson.OPT_APPEND_NEWLINE))
+        except Exception as e:
+            logger.error(f"Failed to append job {job_id} to seen jobs journal: {e}", exc_info=True)
             return
-            
-        logger.info(f"Marking job {job_id} as seen")
-        self.seen_job_ids.add(job_id)
-        self._save_seen_jobs()
+        self._journal_records += 1
+        self._pending_writes += 1
+    
+    def _evict_oldest(self) -> None:
+        """Drop the least recently seen IDs beyond MAX_SEEN_JOBS; compaction removes them from disk."""
+        excess = len(self.seen_job_ids) - self.MAX_SEEN_JOBS
+        if excess <= 0:
+            return
+        for _ in range(excess):
+            self.seen_job_ids.popitem(last=False)
+        logger.debug(f"Evicted {excess} oldest seen job ID(s)")
+    
+    def flush(self) -> None:
+        """Flush appended job IDs to disk if any were added since the last flush."""
+        if not self._pending_writes:
+            return
+        try:
+            self._journal.flush()
+            logger.debug(f"Flushed {self._pending_writes} seen job ID(s) to {self.seen_jobs_file}")
+        except Exception as e:
+            logger.error(f"Failed to flush seen jobs journal: {e}", exc_info=True)
+        self._pending_writes = 0
+        
+        if self._needs_compaction():
+            self._journal.close()
+            self._save_seen_jobs()
+            self._journal = open(self.seen_jobs_file, 'ab')
+    
+    def close(self) -> None:
+        """Flush pending job IDs and close the seen jobs journal."""
+        self.flush()
+        self._journal.close()
+    
+    def _needs_compaction(self) -> bool:
+        """Check whether the journal has grown past COMPACT_RATIO records per ID."""
+        return self._journal_records > self.COMPACT_RATIO * max(len(self.seen_job_ids), 1)
     
     def _save_seen_jobs(self) -> None:
-        """Save seen job IDs to file."""
+        """Rewrite the journal with the current, de-duplicated IDs, oldest first."""
+        temp_file = self.seen_jobs_file.with_suffix('.tmp')
         try:
-            data = {"seen_job_ids": list(self.seen_job_ids)}
-            temp_file = self.seen_jobs_file.with_suffix('.tmp')
-            
             # Write to a temporary file first
             with open(temp_file, 'wb') as f:
-                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                f.writelines(orjson.dumps({"id": job_id}, option=orjson.OPT_APPEND_NEWLINE) for job_id in self.seen_job_ids)
+                f.flush()
+                os.fsync(f.fileno())
             
-            # Atomically replace the old file
-            if sys.platform == 'win32':
-                # On Windows, we can't do atomic replace, so we'll just overwrite
-                if self.seen_jobs_file.exists():
-                    self.seen_jobs_file.unlink()
-                temp_file.rename(self.seen_jobs_file)
-            else:
-                # On Unix-like systems, we can do an atomic replace
-                temp_file.replace(self.seen_jobs_file)
+            # Atomically replace the old file (os.replace overwrites on Windows too)
+            os.replace(temp_file, self.seen_jobs_file)
+            self._journal_records = len(self.seen_job_ids)
+            
+            # The legacy JSON file has been folded into the journal
+            if self.legacy_seen_jobs_file.exists():
+                self.legacy_seen_jobs_file.unlink()
                 
             logger.debug(f"Saved {len(self.seen_job_ids)} seen job IDs to {self.seen_jobs_file}")
             
@@ -136,12 +211,17 @@ class UpworkJobSniper:
     
     def __init__(self):
         """Initialize the application."""
-        self.should_exit = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._exit_event: Optional[asyncio.Event] = None
+        # Jobs picked up by a search that is still analyzing them, so
+        # concurrent searches don't process the same job twice
+        self._claimed_job_ids: Set[str] = set()
         self.upwork = UpworkGraphQLClient()
         self.job_tracker = JobTracker(settings.DATA_DIR)
         self.notifier = PushoverNotifier()
+        # Sends notifications in the background so searches don't wait on Pushover
+        self.notification_worker = NotificationWorker(self.notifier)
         self.ai_analyzer = JobAnalyzer() if settings.ENABLE_AI_ANALYSIS else None
-        self.setup_signal_handlers()
         
         # Log component status
         if self.notifier.is_configured():
@@ -154,63 +234,63 @@ class UpworkJobSniper:
         else:
             logger.warning("AI analysis is disabled. Set ENABLE_AI_ANALYSIS=true to enable job scoring and summarization.")
     
-    def setup_signal_handlers(self):
-        """Set up signal handlers for graceful shutdown."""
-        signal.signal(signal.SIGINT, self.handle_exit)
-        signal.signal(signal.SIGTERM, self.handle_exit)
+    def setup_signal_handlers(self) -> None:
+        """Register shutdown handlers on the running event loop."""
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(sig, self.handle_exit)
+            except NotImplementedError:
+                # Windows event loops don't support add_signal_handler
+                signal.signal(sig, lambda signum, frame: self.handle_exit())
+    
+    @property
+    def should_exit(self) -> bool:
+        """Whether shutdown has been requested."""
+        return self._exit_event is not None and self._exit_event.is_set()
     
-    def handle_exit(self, signum, frame):
+    def handle_exit(self) -> None:
         """Handle application shutdown."""
         logger.info("Shutting down gracefully...")
-        self.should_exit = True
+        # Setting the event also wakes the main loop if it is waiting between searches
+        if self._loop is not None and self._exit_event is not None:
+            self._loop.call_soon_threadsafe(self._exit_event.set)
     
-    def _format_job_details(self, job: Dict[str, Any]) -> str:
+    def _format_job_details(self, job: JobView) -> str:
         """Format job details for logging and display."""
-        if not job:
-            return "No job details available"
-            
-        lines = []
-        
-        # Safely extract client information
-        client = job.get('client') or {}
-        
         # Add job title and ID
-        lines.append(f"Title: {job.get('title', 'N/A')} (ID: {job.get('id', 'N/A')})")
+        lines = [f"Title: {job.title or 'N/A'} (ID: {job.id or 'N/A'})"]
         
         # Add job description (first 200 chars)
-        description = job.get('description', '')
+        description = job.description
         if description:
-            desc = (description[:200] + '...') if len(description) > 200 else description
+            desc = description if len(description) <= 200 else f"{description[:200]}..."
             lines.append(f"Description: {desc}")
         
         # Add budget information
-        hourly_min = job.get('hourlyBudgetMin', {}) or {}
-        hourly_max = job.get('hourlyBudgetMax', {}) or {}
-        amount = job.get('amount', {}) or {}
-        
-        if hourly_min.get('displayValue') and hourly_max.get('displayValue'):
-            min_rate = hourly_min.get('displayValue', 'N/A')
-            max_rate = hourly_max.get('displayValue', 'N/A')
-            lines.append(f"Hourly Rate: {min_rate} - {max_rate}")
-        elif amount.get('displayValue'):
-            lines.append(f"Budget: {amount.get('displayValue', 'N/A')}")
+        if job.hourly_min and job.hourly_max:
+            lines.append(f"Hourly Rate: {job.hourly_min} - {job.hourly_max}")
+        elif job.amount:
+            lines.append(f"Budget: {job.amount}")
         
         # Add client information if available
-        if client:
-            total_spent = (client.get('totalSpent') or {}).get('displayValue', 'N/A')
-            client_info = [
-                f"Client: {client.get('totalReviews', 0)} reviews",
-                f"Spent: {total_spent}",
-                f"Hires: {client.get('totalHires', 'N/A')}",
-                f"Verification: {client.get('verificationStatus', 'N/A')}"
-            ]
-            lines.extend(client_info)
+        if job.has_client:
+            lines.append("\n".join((
+                f"Client: {job.client_reviews} reviews",
+                f"Spent: {job.client_spent}",
+                f"Hires: {job.client_hires}",
+                f"Verification: {job.verification}",
+            )))
         
         return "\n".join(lines)
     
-    async def process_job(self, job_node: Dict[str, Any]) -> None:
-        """Process a single job."""
-        job = job_node.get('node', {}) if 'node' in job_node else job_node
+    async def process_job(
+        self,
+        job_node: Dict[str, Any],
+        job_analysis: Optional[JobAnalysis] = None,
+        job_view: Optional[JobView] = None,
+    ) -> None:
+        """Process a single job, using its precomputed AI analysis and view if any."""
+        job = job_node.get('node') or job_node
         job_id = job.get('id')
         
         if not job_id:
@@ -219,17 +299,12 @@ class UpworkJobSniper:
         
         # Log the job details
         logger.info(f"Found new job: {job.get('title')} (ID: {job_id})")
-        logger.debug(f"Job details:\n{self._format_job_details(job)}")
-        
-        notification_sent = False
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Job details:\n%s", self._format_job_details(job_view or JobView.from_node(job)))
         
         try:
-            # AI Analysis
-            job_analysis = None
+            # AI Analysis (performed in batch by run_search)
             if self.ai_analyzer:
-                logger.debug(f"Analyzing job {job_id} with AI...")
-                job_analysis = self.ai_analyzer.analyze_job(job)
-                
                 if job_analysis:
                     logger.info(f"Job {job_id} scored {job_analysis.score}/10: {job_analysis.summary[:100]}...")
                 else:
@@ -240,15 +315,14 @@ class UpworkJobSniper:
             if job_analysis and self.ai_analyzer:
                 should_notify = self.ai_analyzer.should_notify(job_analysis)
                 if not should_notify:
-                    logger.info(f"Job {job_id} score ({job_analysis.score}) below threshold ({settings.MIN_NOTIFICATION_SCORE}), skipping notification")
+                    logger.info(f"Job {job_id} score ({job_analysis.score}) below threshold ({self.ai_analyzer.min_score}), skipping notification")
             
             # Send notification if conditions are met
             if should_notify and self.notifier.is_configured():
-                notification_sent = self.notifier.send_job_notification(job, job_analysis)
-                if notification_sent:
-                    logger.info(f"Sent notification for job {job_id}")
+                if self.notification_worker.submit(job, job_analysis):
+                    logger.debug(f"Queued notification for job {job_id}")
                 else:
-                    logger.warning(f"Failed to send notification for job {job_id}")
+                    logger.warning(f"Failed to queue notification for job {job_id}")
             elif not self.notifier.is_configured():
                 logger.debug(f"Processed job {job_id} (notifications not configured)")
             else:
@@ -270,44 +344,65 @@ class UpworkJobSniper:
         try:
             logger.info(f"Searching for: {search_config['query']} (${search_config['hourly_rate_min']}/hr, ${search_config['budget_min']} min)")
             
-            # Get jobs from Upwork
-            jobs = self.upwork.search_jobs(
-                query=search_config['query'],
-                hourly_rate_min=search_config['hourly_rate_min'],
-                budget_min=search_config['budget_min'],
-                limit=search_config.get('limit', 10)
+            # Get jobs from Upwork (blocking HTTP call, run off the event loop)
+            jobs = await asyncio.get_running_loop().run_in_executor(
+                None,
+                partial(
+                    self.upwork.search_jobs,
+                    query=search_config['query'],
+                    hourly_rate_min=search_config['hourly_rate_min'],
+                    budget_min=search_config['budget_min'],
+                    limit=search_config.get('limit', 10)
+                )
             )
             
-            # Process new jobs one at a time
-            new_jobs = 0
-            processed_jobs = 0
-            
-            for job in jobs:
-                if self.should_exit:
-                    break
-                    
+            # Work out the new jobs with one set difference so they can be analyzed in one batch
+            jobs_by_id: Dict[str, Dict[str, Any]] = {}
+            for job in jobs[:search_config.get('limit', 10)]:
                 job_id = job.get('id')
-                if not job_id:
+                if job_id:
+                    jobs_by_id.setdefault(job_id, job)
+                else:
                     logger.warning("Skipping job with missing ID")
-                    continue
+            
+            claimed = self._claimed_job_ids
+            new_ids = jobs_by_id.keys() - self.job_tracker.seen_job_ids.keys() - claimed
+            claimed |= new_ids
+            new_jobs = [job for job_id, job in jobs_by_id.items() if job_id in new_ids]
+            # Jobs still showing up in results are re-marked so they are evicted last
+            for job_id in jobs_by_id.keys() & self.job_tracker.seen_job_ids.keys():
+                self.job_tracker.mark_job_seen(job_id)
+            logger.debug(f"{len(new_jobs)} new and {len(jobs_by_id) - len(new_jobs)} seen job(s) for query: {search_config['query']}")
+            
+            try:
+                # Flatten each job once for both AI analysis and logging
+                views = [JobView.from_node(job.get('node') or job) for job in new_jobs]
                 
-                # Process one job at a time
-                if self.job_tracker.is_new_job(job_id):
-                    logger.debug(f"Processing new job: {job_id}")
-                    await self.process_job(job)
-                    new_jobs += 1
+                # AI analysis for all new jobs at once
+                if self.ai_analyzer and views:
+                    analyses = await self.ai_analyzer.analyze_jobs(views)
                 else:
-                    logger.debug(f"Skipping seen job: {job_id}")
+                    analyses = [None] * len(views)
                 
-                processed_jobs += 1
-                if processed_jobs >= search_config.get('limit', 10):
-                    break
-                
-                # Small delay between jobs
-                await asyncio.sleep(1)
+                # Process the jobs concurrently; notifications are queued for the background worker
+                if not self.should_exit:
+                    await asyncio.gather(*(
+                        self.process_job(job, job_analysis, job_view)
+                        for job, job_analysis, job_view in zip(new_jobs, analyses, views)
+                    ))
+                    
+                    # Every job is now marked seen, so later searches can skip older postings
+                    self.upwork.advance_search_watermark(
+                        jobs,
+                        query=search_config['query'],
+                        hourly_rate_min=search_config['hourly_rate_min'],
+                        budget_min=search_config['budget_min']
+                    )
+            finally:
+                claimed.difference_update(job['id'] for job in new_jobs)
             
-            logger.info(f"Found {len(jobs)} jobs, {new_jobs} new for query: {search_config['query']}")
-            return new_jobs
+            logger.info(f"Found {len(jobs)} jobs, {len(new_jobs)} new for query: {search_config['query']}")
+            return len(new_jobs)
             
         except UpworkAuthenticationError as e:
             logger.error(f"Authentication error: {e}")
@@ -319,63 +414,119 @@ class UpworkJobSniper:
     async def run(self):
         """Run the main application loop."""
         logger.info("Starting Upwork Job Sniper...")
+        self._loop = asyncio.get_running_loop()
+        self._exit_event = asyncio.Event()
+        self.setup_signal_handlers()
+        self.notification_worker.start()
         
         # No explicit connection needed for GraphQL client
         logger.info("Upwork GraphQL client initialized")
         
-        # 10 minutes in seconds
-        SEARCH_INTERVAL = 10 * 60
+        # Settings don't change while running; read them once up front
+        hourly_rate_min = settings.HOURLY_RATE_MIN
+        budget_min = settings.BUDGET_MIN
+        min_interval = settings.SEARCH_MIN_INTERVAL
+        max_interval = settings.SEARCH_MAX_INTERVAL
+        backoff_factor = settings.SEARCH_BACKOFF_FACTOR
+        
+        # Seconds between searches; backs off while no new jobs are found
+        interval = min_interval
+        
+        # One search per configured query, all run concurrently each cycle
+        search_configs = [
+            {
+                'query': query,
+                'hourly_rate_min': hourly_rate_min,
+                'budget_min': budget_min,
+                'limit': settings.SEARCH_LIMIT,
+            }
+            for query in (settings.SEARCH_QUERIES or [settings.SEARCH_QUERY])
+        ]
+        queries = ", ".join(f"'{c['query']}'" for c in search_configs)
         
         try:
             while not self.should_exit:
-                logger.info(f"Searching for '{settings.SEARCH_QUERY}' jobs (${settings.HOURLY_RATE_MIN}+/hr, ${settings.BUDGET_MIN}+ budget)...")
+                logger.info(f"Searching for {queries} jobs (${hourly_rate_min}+/hr, ${budget_min}+ budget)...")
                 
                 try:
-                    # Search with configured parameters
-                    jobs = self.upwork.search_jobs(
-                        query=settings.SEARCH_QUERY,
-                        hourly_rate_min=settings.HOURLY_RATE_MIN,
-                        budget_min=settings.BUDGET_MIN,
-                        limit=settings.SEARCH_LIMIT
+                    results = await asyncio.gather(
+                        *(self.run_search(config) for config in search_configs),
+                        return_exceptions=True
                     )
-                    logger.info(f"Found {len(jobs)} jobs")
-                    
-                    # Process new jobs
-                    new_jobs = 0
-                    for job in jobs:
-                        job_id = job.get('id')
-                        if job_id and self.job_tracker.is_new_job(job_id):
-                            await self.process_job(job)
-                            self.job_tracker.mark_job_seen(job_id)
-                            new_jobs += 1
+                    for result in results:
+                        if isinstance(result, BaseException):
+                            raise result
                     
+                    new_jobs = sum(results)
                     logger.info(f"Processed {new_jobs} new jobs")
+                    self.job_tracker.flush()
+                    
+                    # Reset to the base interval on any hit, otherwise back off
+                    if new_jobs:
+                        next_interval = min_interval
+                    else:
+                        next_interval = min(interval * backoff_factor, max_interval)
+                    if next_interval != interval:
+                        logger.info(f"Search interval changed from {interval:g}s to {next_interval:g}s")
+                        interval = next_interval
                             
                 except UpworkAuthenticationError:
                     logger.error("Authentication error. Please check your credentials.")
-                    self.should_exit = True
+                    self._exit_event.set()
                     break
                 except Exception as e:
                     logger.error(f"Error in search: {e}", exc_info=True)
                 
                 # Wait before next search
                 if not self.should_exit:
-                    logger.info(f"Waiting {SEARCH_INTERVAL//60} minutes until next search...")
-                    for _ in range(SEARCH_INTERVAL):
-                        if self.should_exit:
-                            break
-                        await asyncio.sleep(1)
+                    logger.info(f"Waiting {interval / 60:.1f} minutes until next search...")
+                    try:
+                        await asyncio.wait_for(self._exit_event.wait(), timeout=interval)
+                    except asyncio.TimeoutError:
+                        pass
                     
         except Exception as e:
             logger.error(f"An error occurred: {e}", exc_info=True)
         finally:
+            await self.notification_worker.stop()
+            self.job_tracker.close()
+            self.notifier.close()
             logger.info("Upwork Job Sniper has been shut down.")
 
 
+def setup_logging() -> None:
+    """Configure console and file logging for the application."""
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    
+    # Size-bounded log file; records are buffered and written in batches,
+    # flushed immediately on warnings and errors
+    file_handler = logging.handlers.RotatingFileHandler(
+        settings.LOGS_DIR / "upwork_sniper.log",
+        maxBytes=10_000_000,
+        backupCount=3,
+        delay=True,
+    )
+    file_handler.setFormatter(formatter)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=100,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+    )
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        handlers=[console_handler, buffered_file_handler]
+    )
+
+
 def main():
     """Initialize and run the application."""
-    # Create data directory if it doesn't exist
-    settings.DATA_DIR.mkdir(parents=True, exist_ok=True)
+    # Create data and logs directories before anything writes to them
+    create_dirs(settings)
+    setup_logging()
     
     # Initialize and run the application
     app = UpworkJobSniper()
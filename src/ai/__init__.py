@@ -1,5 +1,5 @@
 """AI-powered job analysis and scoring module."""
 
-from .job_analyzer import JobAnalyzer, JobAnalysis
+from .job_analyzer import JobAnalyzer, JobAnalysis, JobView
 
-__all__ = ["JobAnalyzer", "JobAnalysis"]
\ No newline at end of file
+__all__ = ["JobAnalyzer", "JobAnalysis", "JobView"]
\ No newline at end of file
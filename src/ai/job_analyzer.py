@@ -1,12 +1,15 @@
 """AI-powered job analysis using OpenAI GPT models."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, Tuple
+import re
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 
 import openai
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI, OpenAI
 
 try:
     from config.settings import settings
@@ -18,6 +21,16 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_SCORE_RE = re.compile(r'\d+')
+
+# Section headers of the plain-text analysis format, keyed by upper-cased name
+_SECTION_HEADERS = {
+    'SUMMARY': 'summary',
+    'SCORE': 'score',
+    'PROPOSAL_SCRIPT': 'proposal',
+    'REASONING': 'reasoning',
+}
+
 @dataclass
 class JobAnalysis:
     """Data class for job analysis results."""
@@ -39,165 +52,208 @@ class JobAnalysis:
             "reasoning": self.reasoning
         }
 
+@dataclass
+class JobView:
+    """Flattened view of a job posting, extracted once per job.
+    
+    Missing or null nested objects are resolved here so consumers can read
+    plain attributes instead of repeating ``.get() or {}`` chains.
+    """
+    __slots__ = (
+        'id', 'title', 'description', 'hourly_min', 'hourly_max', 'amount',
+        'has_client', 'client_reviews', 'client_spent', 'client_hires',
+        'verification', 'skills_text',
+    )
+    
+    id: Optional[str]
+    title: Optional[str]
+    description: Optional[str]
+    hourly_min: Optional[str]
+    hourly_max: Optional[str]
+    amount: Optional[str]
+    has_client: bool
+    client_reviews: Any
+    client_spent: Any
+    client_hires: Any
+    verification: Any
+    skills_text: str
+    
+    @classmethod
+    def from_node(cls, job: Dict[str, Any]) -> "JobView":
+        """Build a view from a job dictionary returned by the Upwork API."""
+        client = job.get('client') or {}
+        skills = job.get('skills') or []
+        return cls(
+            id=job.get('id'),
+            title=job.get('title'),
+            description=job.get('description'),
+            hourly_min=(job.get('hourlyBudgetMin') or {}).get('displayValue'),
+            hourly_max=(job.get('hourlyBudgetMax') or {}).get('displayValue'),
+            amount=(job.get('amount') or {}).get('displayValue'),
+            has_client=bool(client),
+            client_reviews=client.get('totalReviews', 0),
+            client_spent=(client.get('totalSpent') or {}).get('displayValue', 'N/A'),
+            client_hires=client.get('totalHires', 'N/A'),
+            verification=client.get('verificationStatus', 'N/A'),
+            skills_text=', '.join([skill['name'] for skill in skills if skill.get('name')]),
+        )
+
 class JobAnalyzer:
     """AI-powered job analyzer using OpenAI."""
     
+    # Longer descriptions are cut before prompting to bound token usage
+    MAX_DESCRIPTION_CHARS = 2000
+    
     def __init__(self):
         """Initialize the job analyzer."""
         self.client = OpenAI(api_key=settings.OPENAI_API_KEY.get_secret_value())
         self.model = getattr(settings, 'OPENAI_MODEL', 'gpt-4o-mini')
         self.temperature = getattr(settings, 'OPENAI_TEMPERATURE', 0.3)
         self.max_tokens = getattr(settings, 'OPENAI_MAX_TOKENS', 1000)
+        self.min_score = getattr(settings, 'MIN_NOTIFICATION_SCORE', 7)
+        self._async_client: Optional[AsyncOpenAI] = None
         
         logger.info(f"JobAnalyzer initialized with model: {self.model}")
     
-    def analyze_job(self, job: Dict[str, Any]) -> Optional[JobAnalysis]:
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async OpenAI client used for concurrent analyses, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY.get_secret_value())
+        return self._async_client
+    
+    def analyze_job(self, job: Union[JobView, Dict[str, Any]]) -> Optional[JobAnalysis]:
         """
         Analyze a job posting using AI.
         
         Args:
-            job: Job data dictionary from Upwork API
+            job: JobView or job data dictionary from Upwork API
             
         Returns:
             JobAnalysis object with summary, score, and proposal script
         """
+        view = job if isinstance(job, JobView) else JobView.from_node(job)
+        job_id = view.id or 'unknown'
         try:
-            job_id = job.get('id', 'unknown')
             logger.info(f"Analyzing job {job_id} with AI")
             
-            # Build the prompt
-            prompt = self._build_analysis_prompt(job)
-            
             # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert freelancer and proposal writer who helps evaluate Upwork job postings."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
-            )
+            response = self.client.chat.completions.create(**self._completion_params(view))
+            
+            return self._build_analysis(job_id, response)
             
-            # Parse the response
-            analysis_text = response.choices[0].message.content.strip()
-            summary, score, proposal_script, reasoning = self._parse_analysis_response(analysis_text)
+        except Exception as e:
+            logger.error(f"Failed to analyze job {job_id}: {e}", exc_info=True)
+            return None
+    
+    async def analyze_jobs(self, jobs: List[Union[JobView, Dict[str, Any]]]) -> List[Optional[JobAnalysis]]:
+        """
+        Analyze several job postings concurrently.
+        
+        Args:
+            jobs: JobViews or job data dictionaries from Upwork API
+            
+        Returns:
+            One JobAnalysis (or None on failure) per job, in input order
+        """
+        return list(await asyncio.gather(*(self._analyze_job_async(job) for job in jobs)))
+    
+    async def _analyze_job_async(self, job: Union[JobView, Dict[str, Any]]) -> Optional[JobAnalysis]:
+        """Analyze a single job posting through the async OpenAI client."""
+        view = job if isinstance(job, JobView) else JobView.from_node(job)
+        job_id = view.id or 'unknown'
+        try:
+            logger.info(f"Analyzing job {job_id} with AI")
             
-            analysis = JobAnalysis(
-                job_id=job_id,
-                summary=summary,
-                score=score,
-                proposal_script=proposal_script,
-                analysis_timestamp=datetime.now(),
-                reasoning=reasoning
-            )
+            response = await self.async_client.chat.completions.create(**self._completion_params(view))
             
-            logger.info(f"Job {job_id} analyzed - Score: {score}/10")
-            return analysis
+            return self._build_analysis(job_id, response)
             
         except Exception as e:
-            logger.error(f"Failed to analyze job {job.get('id', 'unknown')}: {e}", exc_info=True)
+            logger.error(f"Failed to analyze job {job_id}: {e}", exc_info=True)
             return None
     
-    def _build_analysis_prompt(self, job: Dict[str, Any]) -> str:
-        """Build the analysis prompt from job data."""
-        # Extract job information safely
-        title = job.get('title', 'N/A')
-        description = job.get('description', 'N/A')
-        
-        # Extract budget information
-        hourly_min = job.get('hourlyBudgetMin', {}) or {}
-        hourly_max = job.get('hourlyBudgetMax', {}) or {}
-        amount = job.get('amount', {}) or {}
+    def _completion_params(self, job: JobView) -> Dict[str, Any]:
+        """Build the chat completion request for a job."""
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert freelancer and proposal writer who helps evaluate Upwork job postings."
+                },
+                {
+                    "role": "user", 
+                    "content": self._build_analysis_prompt(job)
+                }
+            ],
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "response_format": {"type": "json_object"}
+        }
+    
+    def _build_analysis(self, job_id: str, response: Any) -> JobAnalysis:
+        """Parse a chat completion response into a JobAnalysis."""
+        analysis_text = response.choices[0].message.content.strip()
+        summary, score, proposal_script, reasoning = self._parse_analysis_response(analysis_text)
         
-        budget_info = "Not specified"
-        if hourly_min.get('displayValue') and hourly_max.get('displayValue'):
-            budget_info = f"Hourly: {hourly_min.get('displayValue')} - {hourly_max.get('displayValue')}"
-        elif amount.get('displayValue'):
-            budget_info = f"Fixed: {amount.get('displayValue')}"
+        analysis = JobAnalysis(
+            job_id=job_id,
+            summary=summary,
+            score=score,
+            proposal_script=proposal_script,
+            analysis_timestamp=datetime.now(),
+            reasoning=reasoning
+        )
         
-        # Extract client information
-        client = job.get('client', {}) or {}
-        client_reviews = client.get('totalReviews', 0)
-        client_spent = (client.get('totalSpent') or {}).get('displayValue', 'N/A')
-        client_hires = client.get('totalHires', 'N/A')
-        verification_status = client.get('verificationStatus', 'N/A')
+        logger.info(f"Job {job_id} analyzed - Score: {score}/10")
+        return analysis
+    
+    def _build_analysis_prompt(self, job: Union[JobView, Dict[str, Any]]) -> str:
+        """Build the analysis prompt from job data."""
+        view = job if isinstance(job, JobView) else JobView.from_node(job)
+        description = (view.description or 'N/A')[:self.MAX_DESCRIPTION_CHARS]
         
-        # Extract skills
-        skills = job.get('skills', []) or []
-        skills_text = ', '.join([skill.get('name', '') for skill in skills if skill.get('name')])
+        budget_info = "Not specified"
+        if view.hourly_min and view.hourly_max:
+            budget_info = f"Hourly: {view.hourly_min} - {view.hourly_max}"
+        elif view.amount:
+            budget_info = f"Fixed: {view.amount}"
         
         prompt = f"""You are an expert proposal writer analyzing a job posting.
 
 Job Post:
 ---
-Title: {title}
+Title: {view.title or 'N/A'}
 Description: {description}
 Budget: {budget_info}
-Skills Required: {skills_text}
-Client Info: {client_reviews} reviews, Spent: {client_spent}, Hires: {client_hires}, Verification: {verification_status}
+Skills Required: {view.skills_text}
+Client Info: {view.client_reviews} reviews, Spent: {view.client_spent}, Hires: {view.client_hires}, Verification: {view.verification}
 ---
 
-Please provide your analysis in the following format:
+Respond with a JSON object with exactly these keys:
 
-SUMMARY:
-[Write a concise 2-3 sentence summary of what the job entails]
-
-SCORE:
-[Provide a score from 0-10 based on job quality, budget reasonableness, client reliability, and project clarity. Consider: clear requirements, fair budget, good client history, interesting work]
-
-PROPOSAL_SCRIPT:
-[Write a compelling 30-second video proposal script that would win this job. Be specific about relevant experience and value proposition]
-
-REASONING:
-[Briefly explain why you gave this score, highlighting key factors that influenced your decision]"""
+{{
+  "summary": "<a concise 2-3 sentence summary of what the job entails>",
+  "score": <an integer from 0-10 based on job quality, budget reasonableness, client reliability, and project clarity. Consider: clear requirements, fair budget, good client history, interesting work>,
+  "proposal_script": "<a compelling 30-second video proposal script that would win this job. Be specific about relevant experience and value proposition>",
+  "reasoning": "<a brief explanation of why you gave this score, highlighting key factors that influenced your decision>"
+}}"""
 
         return prompt
     
     def _parse_analysis_response(self, response: str) -> Tuple[str, int, str, str]:
         """Parse the AI response into components."""
         try:
-            lines = response.strip().split('\n')
-            summary = ""
-            score = 5  # default score
-            proposal_script = ""
-            reasoning = ""
-            
-            current_section = None
-            
-            for line in lines:
-                line = line.strip()
-                if line.upper().startswith('SUMMARY:'):
-                    current_section = 'summary'
-                    summary = line[8:].strip()
-                elif line.upper().startswith('SCORE:'):
-                    current_section = 'score'
-                    score_text = line[6:].strip()
-                    # Extract number from score text
-                    import re
-                    score_match = re.search(r'(\d+)', score_text)
-                    if score_match:
-                        score = min(10, max(0, int(score_match.group(1))))
-                elif line.upper().startswith('PROPOSAL_SCRIPT:'):
-                    current_section = 'proposal'
-                    proposal_script = line[16:].strip()
-                elif line.upper().startswith('REASONING:'):
-                    current_section = 'reasoning'
-                    reasoning = line[10:].strip()
-                elif line and current_section:
-                    # Continue building the current section
-                    if current_section == 'summary':
-                        summary += " " + line
-                    elif current_section == 'proposal':
-                        proposal_script += " " + line
-                    elif current_section == 'reasoning':
-                        reasoning += " " + line
+            response = response.strip()
+            if response.startswith('{'):
+                data = orjson.loads(response)
+                summary = str(data.get('summary') or '')
+                score = self._extract_score(str(data.get('score', '')))
+                proposal_script = str(data.get('proposal_script') or '')
+                reasoning = str(data.get('reasoning') or '')
+            else:
+                summary, score, proposal_script, reasoning = self._parse_sectioned_response(response)
             
             # Clean up text
             summary = summary.strip()
@@ -205,6 +261,8 @@ REASONING:
             reasoning = reasoning.strip()
             
             # Fallbacks
+            if score is None:
+                score = 5  # default score
             if not summary:
                 summary = "Job analysis summary not available"
             if not proposal_script:
@@ -218,7 +276,53 @@ REASONING:
             logger.error(f"Failed to parse AI response: {e}")
             return "Failed to parse job summary", 5, "Failed to generate proposal script", "Analysis parsing failed"
     
+    @staticmethod
+    def _extract_score(text: str) -> Optional[int]:
+        """Extract a 0-10 score from free text."""
+        score_match = _SCORE_RE.search(text)
+        if score_match:
+            return min(10, max(0, int(score_match.group())))
+        return None
+    
+    def _parse_sectioned_response(self, response: str) -> Tuple[str, Optional[int], str, str]:
+        """Parse a plain-text SUMMARY:/SCORE:/... response (pre-JSON format)."""
+        lines = response.split('\n')
+        summary = ""
+        score = None
+        proposal_script = ""
+        reasoning = ""
+        
+        current_section = None
+        
+        for line in lines:
+            line = line.strip()
+            head, sep, rest = line.partition(':')
+            section = _SECTION_HEADERS.get(head.upper()) if sep else None
+            if section:
+                current_section = section
+                rest = rest.strip()
+                if section == 'summary':
+                    summary = rest
+                elif section == 'score':
+                    score = self._extract_score(rest)
+                elif section == 'proposal':
+                    proposal_script = rest
+                else:
+                    reasoning = rest
+            elif line and current_section:
+                # Continue building the current section
+                if current_section == 'summary':
+                    summary += " " + line
+                elif current_section == 'score':
+                    if score is None:
+                        score = self._extract_score(line)
+                elif current_section == 'proposal':
+                    proposal_script += " " + line
+                elif current_section == 'reasoning':
+                    reasoning += " " + line
+        
+        return summary, score, proposal_script, reasoning
+    
     def should_notify(self, analysis: JobAnalysis) -> bool:
         """Determine if a job should trigger a notification based on score."""
-        min_score = getattr(settings, 'MIN_NOTIFICATION_SCORE', 7)
-        return analysis.score >= min_score
\ No newline at end of file
+        return analysis.score >= self.min_score
\ No newline at end of file
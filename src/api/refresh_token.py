@@ -3,18 +3,37 @@ OAuth2 token management for Upwork API.
 """
 import os
 import base64
+from functools import lru_cache
 from typing import Tuple, Optional, Dict, Any
+import orjson
 import requests
-from dotenv import load_dotenv, set_key
+from dotenv import load_dotenv
 from pathlib import Path
 
+from src.utils.env_file import update_env_file
+
 # Load environment variables
 load_dotenv()
 
+# Snapshot of the environment taken once after .env has been loaded
+_ENV = dict(os.environ)
+
+# Shared session so the connection to upwork.com stays warm across refreshes
+_SESSION = requests.Session()
+
+@lru_cache(maxsize=1)
+def get_client_id() -> str:
+    """Get the OAuth2 client ID; credentials only change on restart."""
+    client_id = _ENV.get("UPWORK_API_KEY")
+    if not client_id:
+        raise ValueError("Missing UPWORK_API_KEY in environment variables")
+    return client_id
+
+@lru_cache(maxsize=1)
 def get_auth_header() -> str:
     """Generate the Basic Auth header for OAuth2 token requests."""
-    client_id = os.getenv("UPWORK_API_KEY")
-    client_secret = os.getenv("UPWORK_API_SECRET")
+    client_id = _ENV.get("UPWORK_API_KEY")
+    client_secret = _ENV.get("UPWORK_API_SECRET")
     
     if not client_id or not client_secret:
         raise ValueError("Missing UPWORK_API_KEY or UPWORK_API_SECRET in environment variables")
@@ -30,7 +49,7 @@ def refresh_access_token() -> bool:
     Returns:
         bool: True if token was refreshed successfully, False otherwise
     """
-    refresh_token = os.getenv("UPWORK_ACCESS_TOKEN_REFRESH")
+    refresh_token = _ENV.get("UPWORK_ACCESS_TOKEN_REFRESH")
     if not refresh_token:
         print("Error: No refresh token found in environment variables")
         return False
@@ -41,34 +60,35 @@ def refresh_access_token() -> bool:
         "Content-Type": "application/x-www-form-urlencoded"
     }
     
-    # Get client_id for the request
-    client_id = os.getenv("UPWORK_API_KEY")
-    
     data = {
         "grant_type": "refresh_token",
         "refresh_token": refresh_token,
-        "client_id": client_id
+        "client_id": get_client_id()
     }
 
     try:
-        response = requests.post(token_url, headers=headers, data=data, timeout=30)
+        response = _SESSION.post(token_url, headers=headers, data=data, timeout=30)
         response.raise_for_status()
         
-        token_data = response.json()
+        token_data = orjson.loads(response.content)
         
         # Update .env file with new tokens
         env_path = Path(__file__).parent.parent.parent / ".env"
-        set_key(env_path, "UPWORK_ACCESS_TOKEN", token_data["access_token"])
-        set_key(env_path, "UPWORK_ACCESS_TOKEN_REFRESH", token_data["refresh_token"])
+        update_env_file(env_path, {
+            "UPWORK_ACCESS_TOKEN": token_data["access_token"],
+            "UPWORK_ACCESS_TOKEN_REFRESH": token_data["refresh_token"],
+        })
         
         # Update environment variables for current session
         os.environ["UPWORK_ACCESS_TOKEN"] = token_data["access_token"]
         os.environ["UPWORK_ACCESS_TOKEN_REFRESH"] = token_data["refresh_token"]
+        _ENV["UPWORK_ACCESS_TOKEN"] = token_data["access_token"]
+        _ENV["UPWORK_ACCESS_TOKEN_REFRESH"] = token_data["refresh_token"]
         
         print("✅ Successfully refreshed access token")
         return True
         
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         print(f"❌ Failed to refresh access token: {str(e)}")
         if hasattr(e, 'response') and e.response is not None:
             print(f"Status code: {e.response.status_code}")
@@ -1,9 +1,19 @@
 """Upwork GraphQL API client implementation with token management."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib.util
 import logging
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+import httpx
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -11,14 +21,16 @@ from urllib3.util.retry import Retry
 # Import settings and token manager
 try:
     from config.settings import settings
-    from src.utils.token_manager import TokenManager
+    from src.utils.async_http import LoopLocalClient
+    from src.utils.token_manager import get_token_manager
 except ImportError:
     # Fallback for direct script execution
     import sys
     from pathlib import Path
     sys.path.append(str(Path(__file__).parent.parent.parent))
     from config.settings import settings
-    from src.utils.token_manager import TokenManager
+    from src.utils.async_http import LoopLocalClient
+    from src.utils.token_manager import get_token_manager
 
 logger = logging.getLogger(__name__)
 
@@ -30,37 +42,292 @@ class UpworkAuthenticationError(UpworkAPIError):
     """Raised when authentication with Upwork API fails."""
     pass
 
+class UpworkGraphQLError(UpworkAPIError):
+    """Raised when the Upwork API answers a request with GraphQL errors."""
+    pass
+
+@lru_cache(maxsize=1)
+def _shared_session() -> requests.Session:
+    """Create the requests session with retry logic shared by all clients.
+    
+    Sharing one session lets every client reuse the same pool of warm
+    keep-alive connections.
+    """
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    # Keep enough pooled keep-alive connections for concurrent searches
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=settings.UPWORK_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=settings.UPWORK_HTTP_POOL_MAXSIZE,
+        pool_block=False,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@lru_cache(maxsize=32)
+def _query_body_prefix(query: str) -> bytes:
+    """Pre-encode the start of a request body for a query; only the variables vary."""
+    return orjson.dumps({"query": query})[:-1] + b',"variables":'
+
+def _encode_request(
+    query: str,
+    variables: Optional[Dict] = None,
+    extensions: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """Encode a GraphQL request body as JSON bytes."""
+    body = _query_body_prefix(query) + orjson.dumps(variables or {})
+    if extensions:
+        body += b',"extensions":' + orjson.dumps(extensions)
+    return body + b"}"
+
+def _create_async_client() -> httpx.AsyncClient:
+    """Create the async HTTP client shared by all clients' async requests.
+    
+    HTTP/2 lets concurrent requests share one connection; it is enabled
+    when the ``h2`` package (``httpx[http2]``) is installed.
+    """
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        timeout=30,
+    )
+
+_async_clients = LoopLocalClient(_create_async_client)
+
+def _shared_async_client() -> httpx.AsyncClient:
+    """Get the async HTTP client for the running event loop."""
+    return _async_clients.get()
+
+def _decode_response(response: Any) -> Any:
+    """Decode a JSON response body with orjson."""
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise UpworkAPIError(f"Invalid JSON in API response: {e}") from e
+
+class _TTLCache:
+    """Small thread-safe cache whose entries expire after a fixed time.
+    
+    Once ``maxsize`` entries are stored the oldest one is evicted.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Any:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+    
+    def set(self, key: Any, value: Any) -> None:
+        """Store value for key for ``ttl`` seconds."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+# Error messages reporting an expired access token
+_TOKEN_EXPIRED_RE = re.compile(r'token[^.]{0,40}expired|expired[^.]{0,40}token', re.IGNORECASE)
+
+def _is_token_expired(errors: List[Dict[str, Any]]) -> bool:
+    """Check whether GraphQL errors report an expired or invalid access token."""
+    return any(
+        (error.get("extensions") or {}).get("code") == "UNAUTHENTICATED"
+        or _TOKEN_EXPIRED_RE.search(error.get("message") or "")
+        for error in errors
+    )
+
+_ORGANIZATION_QUERY = """
+query {
+  organization {
+    id
+    name
+  }
+}
+"""
+
+# The organization query takes no variables, so its body never changes
+_ORGANIZATION_BODY = _encode_request(_ORGANIZATION_QUERY)
+
+# Selects only the fields read by the analyzer, notifier and job logging
+_SEARCH_JOBS_QUERY = """
+query SearchJobs($filter: MarketplaceJobPostingsSearchFilter, $sortAttributes: [MarketplaceJobPostingSearchSortAttribute]) {
+    marketplaceJobPostingsSearch(
+        marketPlaceJobFilter: $filter,
+        searchType: USER_JOBS_SEARCH,
+        sortAttributes: $sortAttributes
+    ) {
+        edges {
+            node {
+                id
+                title
+                description
+                createdDateTime
+                amount {
+                    displayValue
+                }
+                hourlyBudgetMin {
+                    displayValue
+                }
+                hourlyBudgetMax {
+                    displayValue
+                }
+                client {
+                    totalReviews
+                    totalFeedback
+                    verificationStatus
+                    totalPostedJobs
+                    totalHires
+                    totalSpent {
+                        displayValue
+                    }
+                }
+                totalApplicants
+                skills {
+                    name
+                }
+            }
+        }
+    }
+}
+"""
+
+def _persisted_query_extensions(query: str) -> Dict[str, Any]:
+    """Build the persisted query extensions identifying a query by its SHA-256 hash."""
+    return {"persistedQuery": {"version": 1, "sha256Hash": hashlib.sha256(query.encode()).hexdigest()}}
+
+# Lets the server look the search query up by hash instead of re-parsing it
+_SEARCH_JOBS_EXTENSIONS = _persisted_query_extensions(_SEARCH_JOBS_QUERY)
+
+# Shared by single and batched job detail lookups
+_JOB_DETAILS_QUERY = """
+query GetJobDetails($id: ID!) {
+    job: node(id: $id) {
+        ... on JobPosting {
+            id
+            title
+            description
+            createdDateTime
+            duration
+            experienceLevel
+            amount {
+                displayValue
+            }
+            hourlyBudgetMin {
+                displayValue
+            }
+            hourlyBudgetMax {
+                displayValue
+            }
+            client {
+                totalReviews
+                totalFeedback
+                verificationStatus
+                totalPostedJobs
+                totalHires
+                totalSpent {
+                    displayValue
+                }
+            }
+            totalApplicants
+            skills {
+                name
+                category
+            }
+            category {
+                name
+            }
+            subcategory {
+                name
+            }
+        }
+    }
+}
+"""
+
+_JOB_DETAILS_BODY_PREFIX = _query_body_prefix(_JOB_DETAILS_QUERY)
+
+def _encode_job_details_request(job_id: str) -> bytes:
+    """Encode the job details request body for a job ID."""
+    return _JOB_DETAILS_BODY_PREFIX + orjson.dumps({"id": job_id}) + b"}"
+
 class UpworkGraphQLClient:
     """Client for interacting with Upwork's GraphQL API."""
 
     def __init__(self):
         """Initialize the Upwork GraphQL client with OAuth2 authentication."""
-        self.token_manager = TokenManager()
+        self.token_manager = get_token_manager()
         self.endpoint = settings.UPWORK_GRAPHQL_ENDPOINT
-        self.session = self._create_session()
-        self._last_token_refresh = 0
-        self._token_refresh_interval = 3000  # 50 minutes in seconds
+        self.session = _shared_session()
+        self._refresh_failure_count = 0  # Consecutive failed refreshes
+        self._refresh_failure_threshold = 3  # Log tracebacks after this many failures
+        self._details_max_workers = 8  # Concurrent job detail requests (<= pool size)
+        # Newest processed posting time per search filter, to only fetch newer postings
+        self._newest_created_at: Dict[Tuple[str, int, int], str] = {}
+        # Persisted query support: None until the server has accepted or rejected a hash
+        self._persisted_queries_supported: Optional[bool] = None
+        self._registered_query_hashes: Set[str] = set()
+        # Request headers, rebuilt only when the access token changes
+        self._headers_cache: Dict[str, str] = {}
+        self._headers_token: Optional[str] = None
+        # Recent results reused instead of repeating identical requests
+        self._organization_cache = _TTLCache(maxsize=1, ttl=settings.UPWORK_ORGANIZATION_CACHE_TTL)
+        self._job_details_cache = _TTLCache(maxsize=1024, ttl=settings.UPWORK_JOB_DETAILS_CACHE_TTL)
         
         # Log initialization (for debugging)
         logger.info("UpworkGraphQLClient initialized with endpoint: %s", self.endpoint)
     
     def _ensure_valid_token(self) -> None:
-        """Ensure the current access token is valid, refresh if needed."""
-        current_time = time.time()
+        """Ensure the current access token is valid, refresh if needed.
         
-        # Only attempt to refresh if enough time has passed since last refresh
-        if current_time - self._last_token_refresh < self._token_refresh_interval:
+        The token manager decides when to refresh: only near expiry, and
+        not again right after a failed attempt.
+        """
+        try:
+            result = self.token_manager.refresh_if_expiring()
+        except (requests.RequestException, UpworkAPIError) as e:
+            # Transient failures are expected now and then; only include the
+            # traceback once they keep happening
+            self._refresh_failure_count += 1
+            logger.warning(
+                "Token refresh failed: %s", e,
+                exc_info=self._refresh_failure_count > self._refresh_failure_threshold
+            )
             return
         
-        try:
-            success, message = self.token_manager.refresh_access_token()
-            if success:
-                logger.info("Successfully refreshed access token")
-                self._last_token_refresh = current_time
-            else:
-                logger.warning("Failed to refresh access token: %s", message)
-        except Exception as e:
-            logger.error("Error refreshing access token: %s", str(e), exc_info=True)
+        if result is None:
+            return
+        success, message = result
+        if success:
+            self._refresh_failure_count = 0
+            logger.info("Successfully refreshed access token")
+        else:
+            self._refresh_failure_count += 1
+            logger.warning("Failed to refresh access token: %s", message)
     
     @property
     def access_token(self) -> str:
@@ -68,36 +335,45 @@ class UpworkGraphQLClient:
         self._ensure_valid_token()
         return self.token_manager.get_access_token()
         
-    def _create_session(self):
-        """Create a requests session with retry logic."""
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("https://", adapter)
-        return session
-        
     def _get_headers(self) -> Dict[str, str]:
-        """Get the headers for API requests with the current access token."""
+        """Get the headers for API requests with the current access token.
+        
+        Callers are expected to have called _ensure_valid_token() first. The
+        returned dict is shared between requests and must not be mutated.
+        """
+        token = self.token_manager.get_access_token()
+        if token != self._headers_token:
+            self._headers_cache = self._build_headers(token)
+            self._headers_token = token
+        return self._headers_cache
+    
+    @staticmethod
+    def _build_headers(token: str) -> Dict[str, str]:
+        """Build the request headers for the given access token."""
         return {
-            "Authorization": f"Bearer {self.access_token}",
+            "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Connection": "keep-alive",
             "Upwork-API-Version": "1.0",
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "X-Requested-With": "XMLHttpRequest"
         }
         
-    def execute_query(self, query: str, variables: Optional[Dict] = None) -> Dict:
+    def execute_query(
+        self,
+        query: str,
+        variables: Optional[Dict] = None,
+        body: Optional[bytes] = None
+    ) -> Dict:
         """
         Execute a GraphQL query.
         
         Args:
             query: The GraphQL query string
             variables: Optional variables for the query
+            body: Optional pre-encoded request body, used instead of
+                encoding query and variables
             
         Returns:
             Dict containing the response data
@@ -107,10 +383,11 @@ class UpworkGraphQLClient:
             UpworkAPIError: For other API errors
         """
         try:
+            self._ensure_valid_token()
             response = self.session.post(
                 self.endpoint,
                 headers=self._get_headers(),
-                json={"query": query, "variables": variables or {}}
+                data=body if body is not None else _encode_request(query, variables)
             )
             
             # Handle authentication errors
@@ -118,7 +395,7 @@ class UpworkGraphQLClient:
                 raise UpworkAuthenticationError("Invalid or expired access token")
                 
             response.raise_for_status()
-            result = response.json()
+            result = _decode_response(response)
             
             # Check for GraphQL errors
             if 'errors' in result:
@@ -134,19 +411,20 @@ class UpworkGraphQLClient:
         """
         Get organization information for the authenticated user.
         
+        The result is cached for UPWORK_ORGANIZATION_CACHE_TTL seconds.
+        
         Returns:
             Dict containing organization details
         """
-        query = """
-        query {
-          organization {
-            id
-            name
-          }
-        }
-        """
-        result = self.execute_query(query)
-        return result.get('data', {}).get('organization', {})
+        organization = self._organization_cache.get(None)
+        if organization is not None:
+            return organization
+        
+        result = self.execute_query(_ORGANIZATION_QUERY, body=_ORGANIZATION_BODY)
+        organization = result.get('data', {}).get('organization', {})
+        if organization:
+            self._organization_cache.set(None, organization)
+        return organization
         
     def search_jobs(
         self,
@@ -171,79 +449,81 @@ class UpworkGraphQLClient:
             # Ensure we have a valid token before making the request
             self._ensure_valid_token()
             
-            # Build the GraphQL query
-            query_str = """
-            query GetJobs($query: String!, $filters: JobSearchFilters, $paging: Paging) {
-                jobs(
-                    query: $query,
-                    filters: $filters,
-                    paging: $paging
-                ) {
-                    nodes {
-                        id
-                        title
-                        description
-                        createdDateTime
-                        skills {
-                            name
-                        }
-                        client {
-                            name
-                            location {
-                                country
-                            }
-                        }
-                        amount {
-                            amount
-                            currency
-                            type
-                        }
-                        duration
-                        workload
-                        status
-                    }
-                }
+            
+            # Results come back newest first
+            search_filter = {
+                "titleExpression": {"eq": query},
+                "hourlyRate": {"rangeStart": hourly_rate_min},
+                "budgetRange": {"rangeStart": budget_min},
+                "pagination": {"first": limit}
             }
-            """
+            
+            # Only ask for postings at least as new as the newest one already processed
+            newest_seen = self._newest_created_at.get((query, hourly_rate_min, budget_min))
+            if newest_seen:
+                search_filter["createdDateTime"] = {"rangeStart": newest_seen}
             
             variables = {
-                "query": query,
-                "filters": {
-                    "hourlyRate": {"min": hourly_rate_min},
-                    "budget": {"min": budget_min},
-                    "jobType": "hourly,fixed"
-                },
-                "paging": {
-                    "first": limit
-                }
+                "filter": search_filter,
+                "sortAttributes": [{"field": "RECENCY"}]
             }
             
             # Execute the query
-            response = self._execute_query(query_str, variables)
+            response = self._execute_persisted_query(_SEARCH_JOBS_QUERY, _SEARCH_JOBS_EXTENSIONS, variables)
             
             # Process the response
-            jobs = response.get('data', {}).get('jobs', {}).get('nodes', [])
+            edges = ((response.get('data') or {}).get('marketplaceJobPostingsSearch') or {}).get('edges') or []
+            jobs = [edge['node'] for edge in edges if edge.get('node')]
             
-            # Sort jobs by creation date in descending order (newest first)
-            jobs.sort(key=lambda x: x.get('createdDateTime', ''), reverse=True)
-            
-            logger.info(f"Found {len(jobs)} jobs matching the criteria")
+            logger.info("Found %d jobs matching the criteria", len(jobs))
             return jobs
             
         except UpworkAuthenticationError as e:
-            logger.error(f"Authentication error while searching jobs: {e}")
+            logger.error("Authentication error while searching jobs: %s", e)
             raise
         except Exception as e:
             logger.exception("Error while searching jobs")
             raise UpworkAPIError(f"Failed to search jobs: {str(e)}") from e
 
-    def _execute_query(self, query: str, variables: Optional[Dict] = None, retry_on_auth: bool = True) -> Dict:
+    def advance_search_watermark(
+        self,
+        jobs: List[Dict[str, Any]],
+        query: str = "wordpress",
+        hourly_rate_min: int = 30,
+        budget_min: int = 500
+    ) -> None:
+        """
+        Make later searches with the same filter skip postings older than these jobs.
+        
+        Call this once the jobs returned by search_jobs() have been processed,
+        so postings from a search whose processing failed are fetched again.
+        
+        Args:
+            jobs: Jobs returned by search_jobs()
+            query: Search query string the jobs were found with
+            hourly_rate_min: Minimum hourly rate the jobs were found with
+            budget_min: Minimum project budget the jobs were found with
+        """
+        newest = max((job.get('createdDateTime') or '' for job in jobs), default='')
+        if newest:
+            key = (query, hourly_rate_min, budget_min)
+            self._newest_created_at[key] = max(newest, self._newest_created_at.get(key, ''))
+
+    def _execute_query(
+        self,
+        query: str,
+        variables: Optional[Dict] = None,
+        retry_on_auth: bool = True,
+        body: Optional[bytes] = None
+    ) -> Dict:
         """Execute a GraphQL query using the Upwork API with automatic token refresh.
         
         Args:
             query: The GraphQL query string
             variables: Optional variables for the query
             retry_on_auth: Whether to retry once on authentication error
+            body: Optional pre-encoded request body, used instead of
+                encoding query and variables
             
         Returns:
             The parsed JSON response
@@ -260,10 +540,7 @@ class UpworkGraphQLClient:
             response = self.session.post(
                 self.endpoint,
                 headers=self._get_headers(),
-                json={
-                    "query": query,
-                    "variables": variables or {}
-                },
+                data=body if body is not None else _encode_request(query, variables),
                 timeout=30
             )
             
@@ -274,14 +551,14 @@ class UpworkGraphQLClient:
                     success, message = self.token_manager.refresh_access_token()
                     if success:
                         logger.info("Token refreshed, retrying request...")
-                        return self._execute_query(query, variables, retry_on_auth=False)
+                        return self._execute_query(query, variables, retry_on_auth=False, body=body)
                 raise UpworkAuthenticationError("Authentication failed after token refresh")
                 
             # Check for other HTTP errors
             response.raise_for_status()
             
             # Parse the JSON response
-            response_data = response.json()
+            response_data = _decode_response(response)
             
             # Check for GraphQL errors in the response
             if "errors" in response_data:
@@ -290,37 +567,229 @@ class UpworkGraphQLClient:
                 error_message = ", ".join(error_messages)
                 
                 # Handle token expiration in GraphQL errors
-                if any("token" in msg.lower() and "expired" in msg.lower() for msg in error_messages) and retry_on_auth:
+                if retry_on_auth and _is_token_expired(response_data.get("errors") or []):
                     logger.info("Token expired, attempting to refresh...")
                     success, message = self.token_manager.refresh_access_token()
                     if success:
                         logger.info("Token refreshed, retrying request...")
-                        return self._execute_query(query, variables, retry_on_auth=False)
+                        return self._execute_query(query, variables, retry_on_auth=False, body=body)
                 
-                raise UpworkAPIError(f"GraphQL errors: {error_message}")
+                raise UpworkGraphQLError(f"GraphQL errors: {error_message}")
                 
             return response_data
             
         except requests.exceptions.RequestException as e:
             error_msg = str(e)
-            logger.error(f"Request failed: {error_msg}")
+            logger.error("Request failed: %s", error_msg)
             
             # Add more detailed error information if available
             if hasattr(e, 'response') and e.response is not None:
                 try:
                     error_detail = e.response.text
-                    logger.error(f"Response content: {error_detail}")
+                    logger.debug("Response content: %s", error_detail)
                     error_msg = f"{error_msg} - {error_detail}"
                 except Exception as parse_error:
                     logger.error("Failed to parse error response", exc_info=parse_error)
             
             raise UpworkAPIError(f"API request failed: {error_msg}") from e
 
-    # Removed duplicate search_jobs method to use the GraphQL implementation
+    async def _aexecute_query(
+        self,
+        query: str,
+        variables: Optional[Dict] = None,
+        retry_on_auth: bool = True,
+        body: Optional[bytes] = None
+    ) -> Dict:
+        """Async version of _execute_query using the shared httpx client.
+        
+        Args:
+            query: The GraphQL query string
+            variables: Optional variables for the query
+            retry_on_auth: Whether to retry once on authentication error
+            body: Optional pre-encoded request body, used instead of
+                encoding query and variables
+            
+        Returns:
+            The parsed JSON response
+            
+        Raises:
+            UpworkAuthenticationError: If authentication fails after retry
+            UpworkAPIError: For other API errors
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            # Token refreshes are blocking HTTP calls, keep them off the event loop
+            if self.token_manager.token_expiring():
+                await loop.run_in_executor(None, self._ensure_valid_token)
+            
+            response = await _shared_async_client().post(
+                self.endpoint,
+                headers=self._get_headers(),
+                content=body if body is not None else _encode_request(query, variables)
+            )
+            
+            # Handle authentication errors
+            if response.status_code == 401:
+                if retry_on_auth:
+                    logger.info("Received 401, attempting to refresh token...")
+                    success, message = await loop.run_in_executor(None, self.token_manager.refresh_access_token)
+                    if success:
+                        logger.info("Token refreshed, retrying request...")
+                        return await self._aexecute_query(query, variables, retry_on_auth=False, body=body)
+                raise UpworkAuthenticationError("Authentication failed after token refresh")
+            
+            response.raise_for_status()
+            response_data = _decode_response(response)
+            
+            if "errors" in response_data:
+                error_messages = [e.get("message", "Unknown error")
+                                  for e in response_data.get("errors", [])]
+                
+                # Handle token expiration in GraphQL errors
+                if retry_on_auth and _is_token_expired(response_data.get("errors") or []):
+                    logger.info("Token expired, attempting to refresh...")
+                    success, message = await loop.run_in_executor(None, self.token_manager.refresh_access_token)
+                    if success:
+                        logger.info("Token refreshed, retrying request...")
+                        return await self._aexecute_query(query, variables, retry_on_auth=False, body=body)
+                
+                raise UpworkGraphQLError(f"GraphQL errors: {', '.join(error_messages)}")
+            
+            return response_data
+            
+        except httpx.HTTPError as e:
+            logger.error("Request failed: %s", e)
+            raise UpworkAPIError(f"API request failed: {str(e)}") from e
+    
+    def _execute_persisted_query(
+        self,
+        query: str,
+        extensions: Dict[str, Any],
+        variables: Optional[Dict] = None
+    ) -> Dict:
+        """Execute a query as an Apollo-style automatic persisted query.
+        
+        The first request sends the full query together with its SHA-256
+        hash so the server can register it; later requests send only the
+        hash. If the server answers a hash-only request with a GraphQL error
+        before support is known, the request is retried once with the full
+        query; when that succeeds, persisted queries are treated as
+        unsupported and the client sends full queries from then on.
+        
+        Args:
+            query: The GraphQL query string
+            extensions: The query's persisted query extensions, from
+                _persisted_query_extensions()
+            variables: Optional variables for the query
+            
+        Returns:
+            The parsed JSON response
+        """
+        query_hash = extensions["persistedQuery"]["sha256Hash"]
+        hash_rejected = False
+        
+        if self._persisted_queries_supported is not False and query_hash in self._registered_query_hashes:
+            try:
+                result = self._execute_query(
+                    query, variables,
+                    body=orjson.dumps({"variables": variables or {}, "extensions": extensions})
+                )
+                self._persisted_queries_supported = True
+                return result
+            except UpworkAuthenticationError:
+                raise
+            except UpworkGraphQLError as e:
+                if "PersistedQueryNotFound" in str(e):
+                    self._registered_query_hashes.discard(query_hash)
+                elif self._persisted_queries_supported is None:
+                    # Servers word their rejection differently; retry with the full query
+                    logger.info("Query hash rejected (%s), retrying with the full query", e)
+                    hash_rejected = True
+                else:
+                    raise
+            # Other API errors are HTTP and transport failures, which say
+            # nothing about persisted query support and propagate as is
+        
+        if self._persisted_queries_supported is False:
+            return self._execute_query(query, variables)
+        
+        result = self._execute_query(
+            query, variables,
+            body=_encode_request(query, variables, extensions)
+        )
+        if hash_rejected:
+            logger.info("Persisted queries not supported, sending full queries")
+            self._persisted_queries_supported = False
+        else:
+            self._registered_query_hashes.add(query_hash)
+        return result
+    
+    def _execute_batch(
+        self,
+        operations: List[bytes],
+        retry_on_auth: bool = True
+    ) -> List[Dict]:
+        """Execute several GraphQL operations in a single HTTP request.
+        
+        The operations are sent as a JSON array using the batched HTTP
+        transport; a single operation is sent as a plain request so it also
+        works against endpoints without batching support. Per-operation
+        GraphQL errors are left in the returned results for the caller to
+        inspect.
+        
+        Args:
+            operations: Encoded request bodies to execute
+            retry_on_auth: Whether to retry once on authentication error
+            
+        Returns:
+            One parsed JSON response per operation, in the same order
+            
+        Raises:
+            UpworkAuthenticationError: If authentication fails after retry
+            UpworkAPIError: For other API errors
+        """
+        if not operations:
+            return []
+        
+        try:
+            self._ensure_valid_token()
+            
+            batched = len(operations) > 1
+            response = self.session.post(
+                self.endpoint,
+                headers=self._get_headers(),
+                data=b"[" + b",".join(operations) + b"]" if batched else operations[0],
+                timeout=30
+            )
+            
+            if response.status_code == 401:
+                if retry_on_auth:
+                    logger.info("Received 401, attempting to refresh token...")
+                    success, message = self.token_manager.refresh_access_token()
+                    if success:
+                        logger.info("Token refreshed, retrying batch request...")
+                        return self._execute_batch(operations, retry_on_auth=False)
+                raise UpworkAuthenticationError("Authentication failed after token refresh")
+            
+            response.raise_for_status()
+            results = _decode_response(response)
+            if not batched and isinstance(results, dict):
+                results = [results]
+            
+            if not isinstance(results, list) or len(results) != len(operations):
+                raise UpworkAPIError("Unexpected response to batched GraphQL request")
+            
+            return results
+            
+        except requests.exceptions.RequestException as e:
+            logger.error("Batch request failed: %s", e)
+            raise UpworkAPIError(f"API batch request failed: {str(e)}") from e
     
     def get_job_details(self, job_id: str) -> Dict:
         """Get detailed information about a specific job.
         
+        Results are cached for UPWORK_JOB_DETAILS_CACHE_TTL seconds.
+        
         Args:
             job_id: The ID of the job to retrieve
             
@@ -330,70 +799,239 @@ class UpworkGraphQLClient:
         Raises:
             UpworkAPIError: If there's an error with the API request or job not found
         """
-        query = """
-        query GetJobDetails($id: ID!) {
-            job: node(id: $id) {
-                ... on JobPosting {
-                    id
-                    title
-                    description
-                    createdDateTime
-                    duration
-                    experienceLevel
-                    amount {
-                        displayValue
-                    }
-                    hourlyBudgetMin {
-                        displayValue
-                    }
-                    hourlyBudgetMax {
-                        displayValue
-                    }
-                    client {
-                        totalReviews
-                        totalFeedback
-                        verificationStatus
-                        totalPostedJobs
-                        totalHires
-                        totalSpent {
-                            displayValue
-                        }
-                    }
-                    totalApplicants
-                    skills {
-                        name
-                        category
-                    }
-                    category {
-                        name
-                    }
-                    subcategory {
-                        name
-                    }
-                }
-            }
-        }
-        """
+        job_data = self._job_details_cache.get(job_id)
+        if job_data is not None:
+            return job_data
         
         try:
-            logger.info(f"Fetching details for job ID: {job_id}")
-            result = self._execute_query(query, {"id": job_id})
+            logger.info("Fetching details for job ID: %s", job_id)
+            result = self._execute_query(
+                _JOB_DETAILS_QUERY, {"id": job_id}, body=_encode_job_details_request(job_id)
+            )
             
             # Extract the job data from the response
             job_data = result.get('data', {}).get('job')
             if not job_data:
-                logger.warning(f"No job found with ID: {job_id}")
+                logger.warning("No job found with ID: %s", job_id)
                 raise UpworkAPIError(f"Job with ID {job_id} not found")
                 
-            logger.info(f"Successfully retrieved details for job: {job_data.get('title')}")
+            logger.info("Successfully retrieved details for job: %s", job_data.get('title'))
+            self._job_details_cache.set(job_id, job_data)
             return job_data
             
         except Exception as e:
-            logger.error(f"Error retrieving job details: {e}")
+            logger.error("Error retrieving job details: %s", e)
             if isinstance(e, UpworkAPIError):
                 raise
             raise UpworkAPIError(f"Failed to retrieve job details: {str(e)}") from e
+    
+    def get_job_details_many(self, job_ids: List[str]) -> List[Optional[Dict]]:
+        """Get detailed information about several jobs in one HTTP request.
+        
+        Falls back to concurrent single requests if the endpoint rejects
+        batched requests.
+        
+        Args:
+            job_ids: The IDs of the jobs to retrieve
+            
+        Returns:
+            Job details per ID, in the same order; None for jobs that were
+            not found or returned an error
+            
+        Raises:
+            UpworkAuthenticationError: If authentication fails
+        """
+        logger.info("Fetching details for %d job(s)", len(job_ids))
+        try:
+            results = self._execute_batch([_encode_job_details_request(job_id) for job_id in job_ids])
+        except UpworkAuthenticationError:
+            raise
+        except UpworkAPIError as e:
+            logger.warning("Batched job details request failed (%s), fetching concurrently instead", e)
+            with ThreadPoolExecutor(max_workers=self._details_max_workers) as executor:
+                return list(executor.map(self._get_job_details_or_none, job_ids))
+        
+        jobs: List[Optional[Dict]] = []
+        for job_id, result in zip(job_ids, results):
+            if result.get('errors'):
+                logger.warning(
+                    "Error retrieving job %s: %s", job_id,
+                    ", ".join(e.get('message', 'Unknown error') for e in result['errors'])
+                )
+            job_data = (result.get('data') or {}).get('job')
+            if not job_data:
+                logger.warning("No job found with ID: %s", job_id)
+            jobs.append(job_data or None)
+        return jobs
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client used on the running event loop.
+        
+        Call this before the event loop finishes so its pooled connections
+        are closed; the next async request creates a new client.
+        """
+        await _async_clients.aclose()
+    
+    async def aget_job_details(self, job_id: str) -> Dict:
+        """Async version of get_job_details.
+        
+        Args:
+            job_id: The ID of the job to retrieve
+            
+        Returns:
+            Dictionary containing job details
+            
+        Raises:
+            UpworkAPIError: If there's an error with the API request or job not found
+        """
+        result = await self._aexecute_query(
+            _JOB_DETAILS_QUERY, {"id": job_id}, body=_encode_job_details_request(job_id)
+        )
+        job_data = (result.get('data') or {}).get('job')
+        if not job_data:
+            logger.warning("No job found with ID: %s", job_id)
+            raise UpworkAPIError(f"Job with ID {job_id} not found")
+        return job_data
+    
+    async def aget_job_details_many(self, job_ids: List[str]) -> List[Optional[Dict]]:
+        """Get details for several jobs with concurrent async requests.
+        
+        Over HTTP/2 the requests are multiplexed on a single connection.
+        
+        Args:
+            job_ids: The IDs of the jobs to retrieve
+            
+        Returns:
+            Job details per ID, in the same order; None for jobs that were
+            not found or returned an error
+            
+        Raises:
+            UpworkAuthenticationError: If authentication fails
+        """
+        results = await asyncio.gather(
+            *(self.aget_job_details(job_id) for job_id in job_ids),
+            return_exceptions=True
+        )
+        
+        jobs: List[Optional[Dict]] = []
+        for job_id, result in zip(job_ids, results):
+            if isinstance(result, UpworkAuthenticationError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.warning("Error retrieving job %s: %s", job_id, result)
+                jobs.append(None)
+            else:
+                jobs.append(result)
+        return jobs
+    
+    def _get_job_details_or_none(self, job_id: str) -> Optional[Dict]:
+        """Get details for a single job, returning None instead of raising API errors."""
+        try:
+            return self.get_job_details(job_id)
+        except UpworkAuthenticationError:
+            raise
+        except UpworkAPIError:
+            return None
+
+
+class JobDetailsLoader:
+    """Coalesce job detail lookups made close together into batched requests.
+    
+    Lookups made within ``batch_window`` seconds of each other are sent as
+    one call to UpworkGraphQLClient.get_job_details_many(), avoiding a
+    request per job when enriching search results.
+    
+    Example:
+        loader = JobDetailsLoader(get_upwork_client())
+        details = await asyncio.gather(*(loader.load(job["id"]) for job in jobs))
+    """
+    
+    def __init__(
+        self,
+        client: UpworkGraphQLClient,
+        batch_window: float = 0.01,
+        max_batch_size: int = 50
+    ):
+        """Initialize the loader.
+        
+        Args:
+            client: The client used to fetch job details
+            batch_window: Seconds to wait for more lookups before sending a batch
+            max_batch_size: Send a batch as soon as this many jobs are pending
+        """
+        self.client = client
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Batches being fetched; the event loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def load(self, job_id: str) -> Optional[Dict]:
+        """Get details for a job, batched with other pending lookups.
+        
+        Args:
+            job_id: The ID of the job to retrieve
+            
+        Returns:
+            Dictionary containing job details, or None if the job was not
+            found or returned an error
+            
+        Raises:
+            UpworkAPIError: If the batched request fails
+        """
+        future = self._pending.get(job_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[job_id] = loop.create_future()
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.batch_window, self._dispatch)
+        return await asyncio.shield(future)
+    
+    async def load_many(self, job_ids: List[str]) -> List[Optional[Dict]]:
+        """Get details for several jobs; see load()."""
+        return list(await asyncio.gather(*(self.load(job_id) for job_id in job_ids)))
+    
+    def _dispatch(self) -> None:
+        """Send all pending lookups as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._fetch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _fetch(self, batch: Dict[str, asyncio.Future]) -> None:
+        """Fetch a batch of job details and resolve the waiting lookups."""
+        loop = asyncio.get_running_loop()
+        job_ids = list(batch)
+        try:
+            # get_job_details_many uses the blocking requests session
+            results = await loop.run_in_executor(None, self.client.get_job_details_many, job_ids)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for job_id, job_data in zip(job_ids, results):
+            future = batch[job_id]
+            if not future.done():
+                future.set_result(job_data)
+
+
+@lru_cache(maxsize=1)
+def get_upwork_client() -> UpworkGraphQLClient:
+    """Get the shared client instance, creating it on first use."""
+    return UpworkGraphQLClient()
 
 
-# Create a singleton instance for easier imports
-upwork_client = UpworkGraphQLClient()
+def __getattr__(name: str) -> Any:
+    """Create the ``upwork_client`` singleton lazily instead of at import time."""
+    if name == "upwork_client":
+        return get_upwork_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,6 @@ This package contains notification service implementations for sending
 notifications to various platforms (e.g., Pushover, Email, etc.).
 """
 
-from .pushover import PushoverNotifier
+from .pushover import NotificationWorker, PushoverNotifier
 
-__all__ = ['PushoverNotifier']
+__all__ = ['NotificationWorker', 'PushoverNotifier']
@@ -1,18 +1,280 @@
 """Pushover notification service for the Upwork Job Sniper application."""
+import asyncio
+import importlib.util
 import logging
-from typing import Dict, Optional, Any
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from html import unescape
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import urlencode
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
 from config import settings
+from src.utils.async_http import LoopLocalClient
 
 logger = logging.getLogger(__name__)
 
+# Rates and prices mentioned in job titles and descriptions
+_HOURLY_RE = re.compile(r'\$([0-9,.]+)/hr')
+_FIXED_RE = re.compile(r'\$([0-9,]+)(?:\s*-\s*\$?([0-9,]+))?')
+# Used to turn HTML job descriptions into plain text
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+# Whitespace that _WS_RE would change: anything but single spaces
+_MESSY_WS_RE = re.compile(r'[^\S ]|  ')
+# Numeric part of a money display value such as "$1,234.50"
+_NUM_RE = re.compile(r'\d[\d,]*(?:\.\d*)?|\.\d+')
+# Currency and rate markers around a money display value
+_AMOUNT_MARKERS_RE = re.compile(r'\$|/hr')
+
+# Budget display templates
+_HOURLY_TEMPLATE = "💵 ${}/hr"
+_HOURLY_RANGE_TEMPLATE = "💵 ${}-{}/hr"
+_FIXED_TEMPLATE = "💰 ${} (Fixed)"
+_FIXED_RANGE_TEMPLATE = "💰 ${}-{} (Fixed)"
+_FIXED_MIN_TEMPLATE = "💰 ${}+ (Fixed)"
+
+def _format_amount(amount: Any) -> str:
+    """Format a budget amount, dropping a trailing .0 on whole numbers."""
+    if amount is None:
+        return 'N/A'
+    try:
+        amount_str = str(amount)
+        # Remove trailing .0 if it's a whole number
+        if '.' in amount_str and amount_str.endswith('0'):
+            return amount_str.split('.')[0]
+        return amount_str
+    except (TypeError, ValueError):
+        return 'N/A'
+
+def _format_range(min_amount: str, max_amount: str, template: str, range_template: str) -> Optional[str]:
+    """Format a formatted amount range, or None if the minimum is unknown."""
+    if min_amount != 'N/A' and max_amount != 'N/A' and min_amount != max_amount:
+        return range_template.format(min_amount, max_amount)
+    if min_amount != 'N/A':
+        return template.format(min_amount)
+    return None
+
+def _display_amount(money: Dict[str, Any]) -> str:
+    """Format a Money object from its amount or, failing that, its display value."""
+    return _format_amount(
+        money.get('amount') or _AMOUNT_MARKERS_RE.sub('', money.get('displayValue', '')).strip()
+    )
+
+def _format_hourly_budget(budget: Dict[str, Any], job: Dict[str, Any]) -> Optional[str]:
+    """Format an hourly rate in the new ``hourlyBudget`` format."""
+    return _format_range(
+        _format_amount(budget.get('min')), _format_amount(budget.get('max')),
+        _HOURLY_TEMPLATE, _HOURLY_RANGE_TEMPLATE
+    )
+
+def _format_fixed_budget(budget: Dict[str, Any], job: Dict[str, Any]) -> Optional[str]:
+    """Format a fixed price in the new ``budget`` format."""
+    amount = _format_amount(budget.get('amount'))
+    return _FIXED_TEMPLATE.format(amount) if amount != 'N/A' else None
+
+def _format_hourly_budget_min(budget_min: Dict[str, Any], job: Dict[str, Any]) -> Optional[str]:
+    """Format an hourly rate in the old ``hourlyBudgetMin``/``hourlyBudgetMax`` format."""
+    return _format_range(
+        _display_amount(budget_min), _display_amount(job.get('hourlyBudgetMax') or {}),
+        _HOURLY_TEMPLATE, _HOURLY_RANGE_TEMPLATE
+    )
+
+def _format_fixed_amount(amount: Dict[str, Any], job: Dict[str, Any]) -> Optional[str]:
+    """Format a fixed price in the old ``amount`` format."""
+    formatted = _display_amount(amount)
+    return _FIXED_TEMPLATE.format(formatted) if formatted != 'N/A' else None
+
+def _format_budget_range(budget: Dict[str, Any], job: Dict[str, Any]) -> Optional[str]:
+    """Format a fixed price range in the new ``budgetRange`` format."""
+    return _format_range(
+        _format_amount(budget.get('min') or budget.get('rangeStart')),
+        _format_amount(budget.get('max') or budget.get('rangeEnd')),
+        _FIXED_MIN_TEMPLATE, _FIXED_RANGE_TEMPLATE
+    )
+
+# Job fields holding budget information, with their formatters, in order of preference
+_BUDGET_HANDLERS = (
+    ('hourlyBudget', _format_hourly_budget),
+    ('budget', _format_fixed_budget),
+    ('hourlyBudgetMin', _format_hourly_budget_min),
+    ('amount', _format_fixed_amount),
+    ('budgetRange', _format_budget_range),
+)
+
+def _format_budget_from_text(job: Dict[str, Any]) -> str:
+    """Format a rate or price mentioned in the job title or description."""
+    title = str(job.get('title', '')).lower()
+    description = str(job.get('description', '')).lower()
+    
+    # Look for hourly rates in the title or description
+    hourly_match = _HOURLY_RE.search(title) or _HOURLY_RE.search(description)
+    if hourly_match:
+        rate = _format_amount(hourly_match.group(1).replace(',', ''))
+        if rate != 'N/A':
+            return _HOURLY_TEMPLATE.format(rate)
+            
+    # Look for fixed prices in the title or description
+    fixed_match = _FIXED_RE.search(title) or _FIXED_RE.search(description)
+    if fixed_match:
+        min_price = _format_amount(fixed_match.group(1).replace(',', ''))
+        max_price = _format_amount(fixed_match.group(2).replace(',', '')) if fixed_match.group(2) else None
+        if min_price != 'N/A' and max_price and max_price != 'N/A' and min_price != max_price:
+            return _FIXED_RANGE_TEMPLATE.format(min_price, max_price)
+        elif min_price != 'N/A':
+            return _FIXED_TEMPLATE.format(min_price)
+            
+    return "💸 Rate: Not specified"
+
+def _render_compact(fields: Dict[str, str]) -> str:
+    """Render notification fields as compact ``key: value`` lines, skipping empty values."""
+    return "\n".join(f"{key}: {value}" for key, value in fields.items() if value)
+
+# The formatters below are pure functions of their input, so results are
+# cached for jobs that are seen again (reposts, retries)
+
+@lru_cache(maxsize=64)
+def _format_job_type(job_type: str) -> str:
+    """Format a lowercased job type."""
+    if 'hourly' in job_type:
+        return "⏱️ Hourly"
+    elif 'fixed' in job_type:
+        return "📌 Fixed Price"
+    return "📋 Project"
+
+@lru_cache(maxsize=2048)
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing Z for UTC."""
+    # Fast path for the common "YYYY-MM-DDTHH:MM:SSZ" form
+    if len(value) == 20 and value[19] == 'Z':
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            tzinfo=timezone.utc
+        )
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+@lru_cache(maxsize=1024)
+def _clean_description(description: str) -> str:
+    """Strip HTML from a job description and truncate it for a notification."""
+    try:
+        if ('<' in description or '&' in description or description != description.strip()
+                or _MESSY_WS_RE.search(description)):
+            # Remove HTML tags and decode HTML entities
+            clean = _TAG_RE.sub(' ', description)
+            clean = unescape(clean)
+            
+            # Replace multiple spaces and newlines with single space
+            clean = _WS_RE.sub(' ', clean).strip()
+        else:
+            # Plain text that is already clean, which is the common case
+            clean = description
+        
+        # Truncate if too long
+        max_length = 250
+        if len(clean) > max_length:
+            # Cut at the last word boundary, if any
+            cut = clean.rfind(' ', 0, max_length)
+            clean = (clean[:cut] if cut > 0 else clean[:max_length]) + '…'
+            
+        return clean
+    except Exception as e:
+        logger.warning("Failed to clean description: %s", e)
+        return description[:200] + '...' if len(description) > 200 else description
+
+@dataclass
+class ClientStats:
+    """Client details used in notifications, parsed once per job."""
+    __slots__ = ('verified', 'rating', 'hires', 'posted', 'spent_display')
+    
+    verified: bool
+    rating: Optional[float]
+    hires: int
+    posted: int
+    spent_display: Optional[str]
+    
+    @classmethod
+    def from_raw(cls, client: Dict[str, Any]) -> "ClientStats":
+        """Build the stats from a client dictionary returned by the Upwork API."""
+        # Extract the numeric rating (e.g., "4.87" from "4.87 of 5" or just "4.87")
+        rating = None
+        total_feedback = client.get('totalFeedback')
+        if total_feedback:
+            try:
+                rating = float(str(total_feedback).split()[0])
+            except (ValueError, IndexError):
+                pass
+        
+        spent = client.get('totalSpent')
+        return cls(
+            verified=client.get('verificationStatus') == 'VERIFIED',
+            rating=rating,
+            hires=int(client.get('totalHires') or 0),
+            posted=int(client.get('totalPostedJobs') or 0),
+            spent_display=spent.get('displayValue') if isinstance(spent, dict) else None,
+        )
+
+# Responses worth retrying: rate limited or temporarily unavailable
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+@lru_cache(maxsize=256)
+def _encode_form(items: Tuple[Tuple[str, Any], ...]) -> bytes:
+    """Form-encode request parameters; cached so retried notifications are encoded once."""
+    return urlencode(items, doseq=True).encode('ascii')
+
+@lru_cache(maxsize=1)
+def _shared_session() -> requests.Session:
+    """Create the requests session shared by all notifiers.
+    
+    Reusing one session keeps the connection to the Pushover API alive
+    between notifications instead of reconnecting for each one.
+    """
+    session = requests.Session()
+    # Retry POSTs on the same statuses as async sends do; a 5xx retry can
+    # occasionally duplicate an alert, which beats losing it
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=frozenset({"POST"}),
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    return session
+
+def _create_async_client() -> httpx.AsyncClient:
+    """Create the async HTTP client shared by all notifiers' async sends.
+    
+    HTTP/2 lets concurrent notifications share one connection; it is
+    enabled when the ``h2`` package (``httpx[http2]``) is installed.
+    """
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        timeout=10,
+    )
+
+_async_clients = LoopLocalClient(_create_async_client)
+
+def _shared_async_client() -> httpx.AsyncClient:
+    """Get the async HTTP client for the running event loop."""
+    return _async_clients.get()
+
 class PushoverNotifier:
     """Handles sending notifications via Pushover."""
     
     API_URL = "https://api.pushover.net/1/messages.json"
+    # Base delay (seconds) between retries of async sends; doubles each attempt
+    RETRY_BACKOFF = 1.0
     
     def __init__(self, api_token: str = None, user_key: str = None):
         """Initialize the Pushover notifier.
@@ -23,6 +285,7 @@ class PushoverNotifier:
         """
         self.api_token = api_token or settings.PUSHOVER_API_TOKEN
         self.user_key = user_key or settings.PUSHOVER_USER_KEY
+        self.session = _shared_session()
         
         if not self.api_token or not self.user_key:
             logger.warning("Pushover API token or user key not configured. Notifications will be disabled.")
@@ -31,6 +294,14 @@ class PushoverNotifier:
         """Check if the notifier is properly configured."""
         return bool(self.api_token and self.user_key)
     
+    def close(self) -> None:
+        """Close the shared requests session and its pooled connections.
+        
+        Notifiers created afterwards get a new session.
+        """
+        self.session.close()
+        _shared_session.cache_clear()
+    
     def send_notification(
         self,
         title: str,
@@ -58,7 +329,102 @@ class PushoverNotifier:
         if not self.is_configured():
             logger.warning("Pushover not configured, skipping notification")
             return False
+        
+        body = self._encode_payload(self._build_payload(title, message, priority, url, url_title, sound, **kwargs))
+        
+        try:
+            response = self.session.post(self.API_URL, data=body, headers=_FORM_HEADERS, timeout=10)
+            response.raise_for_status()
+            logger.debug("Pushover notification sent: %s", title)
+            return True
+            
+        except RequestException as e:
+            logger.error("Failed to send Pushover notification: %s", e)
+            if getattr(e, 'response', None) is not None and logger.isEnabledFor(logging.ERROR):
+                logger.error("Pushover API response: %s", e.response.text)
+            return False
+    
+    async def asend_notification(
+        self,
+        title: str,
+        message: str,
+        priority: int = 0,
+        url: Optional[str] = None,
+        url_title: Optional[str] = None,
+        sound: Optional[str] = None,
+        **kwargs: Any
+    ) -> bool:
+        """Async version of send_notification using the shared httpx client.
+        
+        Returns:
+            bool: True if the notification was sent successfully, False otherwise
+        """
+        if not self.is_configured():
+            logger.warning("Pushover not configured, skipping notification")
+            return False
+        
+        body = self._encode_payload(self._build_payload(title, message, priority, url, url_title, sound, **kwargs))
+        return await self._apost(body, title)
+    
+    async def _apost(self, body: bytes, title: str, retries: int = 0) -> bool:
+        """Post an encoded notification, retrying rate-limited and failed requests.
+        
+        Args:
+            body: Form-encoded request body
+            title: Notification title, for logging
+            retries: How many times to retry after a 429/5xx response or a
+                connection error, waiting RETRY_BACKOFF * 2**attempt seconds
+            
+        Returns:
+            bool: True if the notification was sent successfully, False otherwise
+        """
+        for attempt in range(retries + 1):
+            try:
+                response = await _shared_async_client().post(self.API_URL, content=body, headers=_FORM_HEADERS)
+                if response.status_code not in _RETRY_STATUSES or attempt == retries:
+                    response.raise_for_status()
+                    logger.debug("Pushover notification sent: %s", title)
+                    return True
+                reason = f"status {response.status_code}"
+                
+            except httpx.TransportError as e:
+                if attempt == retries:
+                    logger.error("Failed to send Pushover notification: %s", e)
+                    return False
+                reason = str(e) or type(e).__name__
+                
+            except httpx.HTTPError as e:
+                logger.error("Failed to send Pushover notification: %s", e)
+                if isinstance(e, httpx.HTTPStatusError) and logger.isEnabledFor(logging.ERROR):
+                    logger.error("Pushover API response: %s", e.response.text)
+                return False
             
+            delay = self.RETRY_BACKOFF * 2 ** attempt
+            logger.warning("Pushover request failed (%s), retrying in %gs", reason, delay)
+            await asyncio.sleep(delay)
+        
+        return False
+    
+    @staticmethod
+    def _encode_payload(payload: Dict[str, Any]) -> bytes:
+        """Form-encode the request parameters, reusing the encoding of repeated payloads."""
+        try:
+            return _encode_form(tuple(payload.items()))
+        except TypeError:
+            # Unhashable values (e.g. lists) can't be cached
+            return urlencode(payload, doseq=True).encode('ascii')
+    
+    def _build_payload(
+        self,
+        title: str,
+        message: str,
+        priority: int = 0,
+        url: Optional[str] = None,
+        url_title: Optional[str] = None,
+        sound: Optional[str] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Build the Pushover API request parameters."""
         payload: Dict[str, Any] = {
             "token": self.api_token,
             "user": self.user_key,
@@ -77,125 +443,41 @@ class PushoverNotifier:
             
         # Add any additional parameters
         payload.update(kwargs)
-        
-        try:
-            response = requests.post(self.API_URL, data=payload, timeout=10)
-            response.raise_for_status()
-            logger.debug(f"Pushover notification sent: {title}")
-            return True
-            
-        except RequestException as e:
-            logger.error(f"Failed to send Pushover notification: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Pushover API response: {e.response.text}")
-            return False
+        return payload
     
     def _format_budget(self, job: Dict[str, Any]) -> str:
         """Format budget information from job details."""
-        def format_amount(amount):
-            if amount is None:
-                return 'N/A'
-            try:
-                amount_str = str(amount)
-                # Remove trailing .0 if it's a whole number
-                if '.' in amount_str and amount_str.endswith('0'):
-                    return amount_str.split('.')[0]
-                return amount_str
-            except (TypeError, ValueError):
-                return 'N/A'
+        # Structured budget fields, in order of preference
+        for key, handler in _BUDGET_HANDLERS:
+            value = job.get(key)
+            if value:
+                formatted = handler(value, job)
+                if formatted:
+                    return formatted
         
-        # Check for hourly rate first in the new format
-        if 'hourlyBudget' in job and job['hourlyBudget']:
-            min_rate = format_amount(job['hourlyBudget'].get('min'))
-            max_rate = format_amount(job['hourlyBudget'].get('max'))
-            if min_rate != 'N/A' and max_rate != 'N/A' and min_rate != max_rate:
-                return f"💵 ${min_rate}-{max_rate}/hr"
-            elif min_rate != 'N/A':
-                return f"💵 ${min_rate}/hr"
-        
-        # Check for fixed price in the new format
-        if 'budget' in job and job['budget']:
-            amount = format_amount(job['budget'].get('amount'))
-            if amount != 'N/A':
-                return f"💰 ${amount} (Fixed)"
-                
-        # Check for hourly rate in the old format
-        if 'hourlyBudgetMin' in job and job['hourlyBudgetMin']:
-            min_rate = format_amount(job['hourlyBudgetMin'].get('amount') or job['hourlyBudgetMin'].get('displayValue', '').replace('$', '').replace('/hr', '').strip())
-            max_rate = format_amount(job.get('hourlyBudgetMax', {}).get('amount') or job.get('hourlyBudgetMax', {}).get('displayValue', '').replace('$', '').replace('/hr', '').strip())
-            if min_rate != 'N/A' and max_rate != 'N/A' and min_rate != max_rate:
-                return f"💵 ${min_rate}-{max_rate}/hr"
-            elif min_rate != 'N/A':
-                return f"💵 ${min_rate}/hr"
-                
-        # Check for fixed price in the old format
-        if 'amount' in job and job['amount']:
-            amount = format_amount(job['amount'].get('amount') or job['amount'].get('displayValue', '').replace('$', '').strip())
-            if amount != 'N/A':
-                return f"💰 ${amount} (Fixed)"
-        
-        # Check for budget range in the new format
-        if 'budgetRange' in job and job['budgetRange']:
-            min_budget = format_amount(job['budgetRange'].get('min') or job['budgetRange'].get('rangeStart'))
-            max_budget = format_amount(job['budgetRange'].get('max') or job['budgetRange'].get('rangeEnd'))
-            if min_budget != 'N/A' and max_budget != 'N/A' and min_budget != max_budget:
-                return f"💰 ${min_budget}-{max_budget} (Fixed)"
-            elif min_budget != 'N/A':
-                return f"💰 ${min_budget}+ (Fixed)"
-                
         # If no budget information is found, check for rate info in the job title or description
-        title = str(job.get('title', '')).lower()
-        description = str(job.get('description', '')).lower()
-        
-        # Look for hourly rates in the title or description
-        import re
-        hourly_match = re.search(r'\$([0-9,.]+)/hr', title) or re.search(r'\$([0-9,.]+)/hr', description)
-        if hourly_match:
-            rate = format_amount(hourly_match.group(1).replace(',', ''))
-            if rate != 'N/A':
-                return f"💵 ${rate}/hr"
-                
-        # Look for fixed prices in the title or description
-        fixed_match = re.search(r'\$([0-9,]+)(?:\s*-\s*\$?([0-9,]+))?', title) or re.search(r'\$([0-9,]+)(?:\s*-\s*\$?([0-9,]+))?', description)
-        if fixed_match:
-            min_price = format_amount(fixed_match.group(1).replace(',', ''))
-            max_price = format_amount(fixed_match.group(2).replace(',', '')) if fixed_match.group(2) else None
-            if min_price != 'N/A' and max_price and max_price != 'N/A' and min_price != max_price:
-                return f"💰 ${min_price}-{max_price} (Fixed)"
-            elif min_price != 'N/A':
-                return f"💰 ${min_price} (Fixed)"
-                
-        return "💸 Rate: Not specified"
+        return _format_budget_from_text(job)
 
-    def _format_client_info(self, client: Optional[Dict[str, Any]]) -> str:
+    def _format_client_info(self, client: Optional[ClientStats]) -> str:
         """Format essential client information including rating and job stats."""
-        if not client or not isinstance(client, dict):
+        if client is None:
             return "👤 New client (no info)"
             
         lines = []
         
         # Basic client info with rating
         client_info = []
-        if client.get('verificationStatus') == 'VERIFIED':
+        if client.verified:
             client_info.append("✅ Verified client")
-            
-        # Add client rating from totalFeedback
-        total_feedback = client.get('totalFeedback')
-        if total_feedback:
-            try:
-                # Extract the numeric rating (e.g., "4.87" from "4.87 of 5" or just "4.87")
-                rating_str = str(total_feedback).split()[0]  # Get first part in case it's "4.87 of 5"
-                rating = float(rating_str)
-                client_info.append(f"⭐ {rating:.1f}")
-            except (ValueError, AttributeError):
-                pass
+        if client.rating is not None:
+            client_info.append(f"⭐ {client.rating:.1f}")
                 
         if client_info:
             lines.append(" • ".join(client_info))
             
         # Job statistics
-        hires = int(client.get('totalHires') or 0)
-        posted = int(client.get('totalPostedJobs') or 0)
+        hires = client.hires
+        posted = client.posted
         
         # Calculate hire rate if possible
         hire_rate = None
@@ -214,46 +496,38 @@ class PushoverNotifier:
             lines.append(" • ".join(stats))
             
         # Add total spent information with rounded value
-        spent = client.get('totalSpent', {})
-        if isinstance(spent, dict):
-            display_value = spent.get('displayValue')
-            if display_value:
-                try:
-                    # Extract the numeric value and round it
-                    amount_str = ''.join(c for c in display_value if c.isdigit() or c == '.')
-                    if amount_str:
-                        amount = float(amount_str)
-                        # Format with K/M suffix if needed
-                        if amount >= 1_000_000:
-                            amount_str = f"${amount/1_000_000:.1f}M"
-                        elif amount >= 1_000:
-                            amount_str = f"${amount/1_000:.0f}K"
-                        else:
-                            amount_str = f"${amount:.0f}"
-                        lines.append(f"💳 {amount_str} total spent")
-                except (ValueError, TypeError):
-                    lines.append(f"💳 {display_value} total spent")
+        display_value = client.spent_display
+        if display_value:
+            try:
+                # Extract the numeric value and round it
+                match = _NUM_RE.search(display_value)
+                if match:
+                    amount = float(match.group(0).replace(',', ''))
+                    # Format with K/M suffix if needed
+                    if amount >= 1_000_000:
+                        amount_str = f"${amount/1_000_000:.1f}M"
+                    elif amount >= 1_000:
+                        amount_str = f"${amount/1_000:.0f}K"
+                    else:
+                        amount_str = f"${amount:.0f}"
+                    lines.append(f"💳 {amount_str} total spent")
+            except (ValueError, TypeError):
+                lines.append(f"💳 {display_value} total spent")
         
         return "\n".join(lines)
 
     def _format_job_type(self, job: Dict[str, Any]) -> str:
         """Format job type information."""
-        job_type = job.get('jobType', '').lower()
-        if 'hourly' in job_type:
-            return "⏱️ Hourly"
-        elif 'fixed' in job_type:
-            return "📌 Fixed Price"
-        return "📋 Project"
+        return _format_job_type(job.get('jobType', '').lower())
 
     def _format_posted_time(self, created_time: str) -> str:
         """Format the posted time to be more readable."""
         if not created_time:
             return "🕒 Just now"
             
-        from datetime import datetime, timezone
         try:
             # Parse the ISO format time
-            dt = datetime.fromisoformat(created_time.replace('Z', '+00:00'))
+            dt = _parse_iso_datetime(created_time)
             now = datetime.now(timezone.utc)
             delta = now - dt
             
@@ -272,27 +546,7 @@ class PushoverNotifier:
         """Clean and format job description."""
         if not description or not isinstance(description, str):
             return ""
-            
-        import re
-        from html import unescape
-        
-        try:
-            # Remove HTML tags and decode HTML entities
-            clean = re.sub(r'<[^>]+>', ' ', description)
-            clean = unescape(clean)
-            
-            # Replace multiple spaces and newlines with single space
-            clean = re.sub(r'\s+', ' ', clean).strip()
-            
-            # Truncate if too long
-            max_length = 250
-            if len(clean) > max_length:
-                clean = clean[:max_length].rsplit(' ', 1)[0] + '...'
-                
-            return clean
-        except Exception as e:
-            logger.warning(f"Failed to clean description: {e}")
-            return description[:200] + '...' if len(description) > 200 else description
+        return _clean_description(description)
 
     def send_job_notification(self, job: Dict[str, Any], job_analysis=None) -> bool:
         """Send a notification for a new job posting.
@@ -304,22 +558,65 @@ class PushoverNotifier:
         Returns:
             bool: True if the notification was sent successfully, False otherwise
         """
+        notification = self._build_job_notification(job, job_analysis)
+        if notification is None:
+            return False
+        return self.send_notification(**notification)
+    
+    async def asend_job_notification(self, job: Dict[str, Any], job_analysis=None, retries: int = 0) -> bool:
+        """Async version of send_job_notification.
+        
+        Args:
+            job: Job details dictionary
+            job_analysis: Optional JobAnalysis object with AI insights
+            retries: How many times to retry a rate-limited or failed request
+        """
+        if not self.is_configured():
+            logger.warning("Pushover not configured, skipping notification")
+            return False
+        
+        notification = self._build_job_notification(job, job_analysis)
+        if notification is None:
+            return False
+        return await self._apost(
+            self._encode_payload(self._build_payload(**notification)), notification["title"], retries
+        )
+    
+    async def send_job_notifications(self, jobs: List[Tuple[Dict[str, Any], Any]]) -> List[bool]:
+        """Send notifications for several jobs concurrently.
+        
+        Args:
+            jobs: (job, job_analysis) pairs; job_analysis may be None
+            
+        Returns:
+            Whether each notification was sent, in the same order
+        """
+        return list(await asyncio.gather(
+            *(self.asend_job_notification(job, job_analysis) for job, job_analysis in jobs)
+        ))
+    
+    def _build_job_notification(self, job: Dict[str, Any], job_analysis=None) -> Optional[Dict[str, Any]]:
+        """Build the send_notification arguments for a job posting.
+        
+        Returns:
+            Keyword arguments for send_notification, or None if the job
+            could not be formatted
+        """
         if not job or not isinstance(job, dict):
             logger.error("Invalid job data provided")
-            return False
+            return None
             
         try:
             job_id = str(job.get('id') or 'unknown').strip()
             job_title = str(job.get('title') or 'Untitled Job').strip()
             
-            # Safely get client info
+            # Parse the client details once
             client = job.get('client')
-            if not isinstance(client, dict):
-                client = {}
+            client_stats = ClientStats.from_raw(client) if client and isinstance(client, dict) else None
             
             # Format notification components
             budget = self._format_budget(job)
-            client_info = self._format_client_info(client)
+            client_info = self._format_client_info(client_stats)
             job_type = self._format_job_type(job)
             posted_time = self._format_posted_time(job.get('createdDateTime'))
             
@@ -329,39 +626,50 @@ class PushoverNotifier:
             except (TypeError, ValueError):
                 applicants = '?'
             
-            # Build notification message with rich formatting
-            message_parts = [
-                f"📢 <b>{job_title}</b>",
-                "",  # Empty line for better readability
-            ]
+            description = None
+            if not (job_analysis and job_analysis.proposal_script):
+                # Add job description if available and no AI proposal script
+                description = self._clean_description(job.get('description'))
             
-            # Add AI analysis if available
             if job_analysis:
+                # Closing section: AI proposal script if available, else the description
+                script = job_analysis.proposal_script
+                if script:
+                    closing: Tuple[str, ...] = (
+                        "",
+                        "🎬 <b>Proposal Script:</b>",
+                        f"<i>{script[:300]}{'…' if len(script) > 300 else ''}</i>",
+                    )
+                elif description:
+                    closing = ("", description)
+                else:
+                    closing = ()
+                
+                # Build notification message with rich formatting
                 score_emoji = "🔥" if job_analysis.score >= 8 else "⭐" if job_analysis.score >= 6 else "📊"
-                message_parts.extend([
+                message = "\n".join((
+                    f"📢 <b>{job_title}</b>",
+                    "",  # Empty line for better readability
                     f"{score_emoji} <b>AI Score: {job_analysis.score}/10</b>",
                     f"📝 {job_analysis.summary}",
-                    ""
-                ])
-            
-            message_parts.extend([
-                f"{budget} • {job_type}",
-                f"{client_info}",
-                f"{posted_time} • {applicants} proposals",
-            ])
-            
-            # Add AI proposal script if available
-            if job_analysis and job_analysis.proposal_script:
-                message_parts.extend([
                     "",
-                    f"🎬 <b>Proposal Script:</b>",
-                    f"<i>{job_analysis.proposal_script[:300]}{'...' if len(job_analysis.proposal_script) > 300 else ''}</i>"
-                ])
+                    f"{budget} • {job_type}",
+                    client_info,
+                    f"{posted_time} • {applicants} proposals",
+                    *closing,
+                ))
             else:
-                # Add job description if available and no AI analysis
-                description = self._clean_description(job.get('description'))
+                # Without AI insights the details are sent as compact plain text
+                message = _render_compact({
+                    "job": job_title,
+                    "budget": budget,
+                    "type": job_type,
+                    "client": client_info.replace("\n", " • "),
+                    "posted": posted_time,
+                    "proposals": applicants,
+                })
                 if description:
-                    message_parts.extend(["", description])
+                    message = f"{message}\n\n{description}"
             
             # Add job URL if available
             job_url = None
@@ -379,19 +687,108 @@ class PushoverNotifier:
                 priority = 1
                 sound = "cashregister"
             
-            # Send the notification to all devices
-            return self.send_notification(
+            # Notification to send to all devices
+            notification: Dict[str, Any] = dict(
                 title=title,
-                message="\n".join(message_parts),
+                message=message,
                 url=job_url,
                 url_title="🔍 View on Upwork" if job_url else None,
                 priority=priority,
                 sound=sound,
-                html=1,  # Enable HTML formatting
                 retry=30,  # Retry every 30 seconds if not acknowledged
                 expire=300  # Stop retrying after 5 minutes
             )
+            if job_analysis:
+                notification["html"] = 1  # Enable HTML formatting
+            return notification
             
         except Exception as e:
-            logger.error(f"Failed to format job notification: {e}", exc_info=True)
+            logger.error("Failed to format job notification: %s", e, exc_info=True)
+            return None
+
+
+class NotificationWorker:
+    """Send job notifications in the background from a bounded queue.
+    
+    Callers enqueue notifications with submit() and carry on; worker tasks
+    send them with retries, so a slow or failing Pushover API doesn't hold
+    up job discovery. When the queue is full new notifications are dropped.
+    """
+    
+    def __init__(
+        self,
+        notifier: PushoverNotifier,
+        workers: int = 4,
+        maxsize: int = 200,
+        max_retries: int = 3
+    ):
+        """Initialize the worker.
+        
+        Args:
+            notifier: The notifier used to send notifications
+            workers: Number of notifications sent concurrently
+            maxsize: Maximum number of queued notifications
+            max_retries: Retries per notification on rate limiting or errors
+        """
+        self.notifier = notifier
+        self.workers = workers
+        self.max_retries = max_retries
+        self._maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+    
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self._maxsize)
+        self._tasks = [asyncio.ensure_future(self._run()) for _ in range(self.workers)]
+    
+    def submit(self, job: Dict[str, Any], job_analysis=None) -> bool:
+        """Queue a notification for a job.
+        
+        Returns:
+            bool: True if the notification was queued, False if the worker
+            isn't running or the queue is full
+        """
+        if not self._tasks:
+            logger.warning("Notification worker not running, dropping notification")
+            return False
+        try:
+            self._queue.put_nowait((job, job_analysis))
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Notification queue full (%d), dropping notification", self._maxsize)
             return False
+    
+    async def stop(self) -> None:
+        """Send the queued notifications, then stop the worker tasks.
+        
+        Also closes the event loop's shared HTTP client, so its connections
+        don't outlive the loop.
+        """
+        if not self._tasks:
+            return
+        for _ in self._tasks:
+            await self._queue.put(None)
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
+        await _async_clients.aclose()
+    
+    async def _run(self) -> None:
+        """Send queued notifications until a None sentinel is received."""
+        while True:
+            item = await self._queue.get()
+            try:
+                if item is None:
+                    return
+                job, job_analysis = item
+                job_id = job.get('id')
+                if await self.notifier.asend_job_notification(job, job_analysis, retries=self.max_retries):
+                    logger.info("Sent notification for job %s", job_id)
+                else:
+                    logger.warning("Failed to send notification for job %s", job_id)
+            except Exception as e:
+                logger.error("Error sending notification: %s", e, exc_info=True)
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,44 @@
+"""Helpers for sharing httpx async clients."""
+import asyncio
+import threading
+from typing import Callable, Dict
+
+import httpx
+
+
+class LoopLocalClient:
+    """
+    Lazily create one shared ``httpx.AsyncClient`` per running event loop.
+
+    An async client's pooled connections belong to the loop they were
+    opened on, so a client cached process-wide breaks on the next
+    ``asyncio.run``. Clients left behind by loops that have since closed
+    are dropped when a new one is created.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]):
+        """
+        Args:
+            factory: Creates a new client for an event loop
+        """
+        self._factory = factory
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self) -> httpx.AsyncClient:
+        """Get the client for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                for closed_loop in [l for l in self._clients if l.is_closed()]:
+                    del self._clients[closed_loop]
+                client = self._clients[loop] = self._factory()
+            return client
+
+    async def aclose(self) -> None:
+        """Close the running event loop's client, if one was created."""
+        with self._lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
@@ -0,0 +1,51 @@
+"""Helpers for updating the application's .env file."""
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict
+
+
+def update_env_file(env_path: Path, updates: Dict[str, str]) -> None:
+    """
+    Set several keys in a .env file with a single atomic rewrite.
+    
+    The new contents are written to a temporary file, fsynced, read back
+    and verified before replacing the original, so a crash can never leave
+    the file with only some of the keys updated.
+    """
+    lines = env_path.read_text().splitlines() if env_path.exists() else []
+    pending = dict(updates)
+    
+    for i, line in enumerate(lines):
+        key = line.split("=", 1)[0].strip()
+        prefix = ""
+        if key.startswith("export "):
+            key = key[len("export "):].strip()
+            prefix = "export "
+        if key in pending:
+            value = pending.pop(key).replace("'", "\\'")
+            lines[i] = f"{prefix}{key}='{value}'"
+    for key, value in pending.items():
+        value = value.replace("'", "\\'")
+        lines.append(f"{key}='{value}'")
+    
+    content = ("\n".join(lines) + "\n").encode()
+    temp_path = env_path.with_name(env_path.name + ".tmp")
+    if temp_path.exists():
+        temp_path.unlink()  # Leftover from an interrupted write
+    
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        if hashlib.sha256(temp_path.read_bytes()).digest() != hashlib.sha256(content).digest():
+            raise OSError(f"Verification of {temp_path} failed")
+        
+        os.replace(temp_path, env_path)
+    except BaseException:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
@@ -1,45 +1,98 @@
 """Token management utilities for Upwork API."""
 import os
 import base64
-import json
+import logging
+import threading
 import time
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple
+import orjson
 import requests
-from dotenv import load_dotenv, set_key
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from src.utils.env_file import update_env_file
+
+# Shared session so the connection to upwork.com stays warm across refreshes
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+logger = logging.getLogger(__name__)
 
 class TokenManager:
     """Manages Upwork API token refresh and storage."""
     
+    # Refresh this many seconds before the access token expires
+    EXPIRY_SKEW = 60
+    # Wait this long after a refresh attempt before trying again
+    REFRESH_RETRY_DELAY = 60
+    
     def __init__(self, env_path: str = '.env'):
         """Initialize the token manager with the path to the .env file."""
         self.env_path = Path(env_path)
         self.load_credentials()
         self.token_info = {}
+        # Refresh currently in progress, shared by concurrent callers
+        self._refresh_lock = threading.Lock()
+        self._refresh_inflight: Optional[Future] = None
+        self._last_refresh_attempt = 0.0
     
     def load_credentials(self) -> None:
         """Load credentials from the .env file."""
         load_dotenv(self.env_path)
         self.client_id = os.getenv('UPWORK_API_KEY')
         self.client_secret = os.getenv('UPWORK_API_SECRET')
+        # Basic auth header for the token endpoint; the client credentials don't change
+        self._basic_auth_header = 'Basic ' + base64.b64encode(
+            f"{self.client_id}:{self.client_secret}".encode('ascii')
+        ).decode('ascii')
         self.access_token = os.getenv('UPWORK_ACCESS_TOKEN', '').strip("'\"")
         self.refresh_token = os.getenv('UPWORK_ACCESS_TOKEN_REFRESH', '').strip("'\"")
+        # Unix time the access token expires at; 0 if unknown (treated as expired)
+        try:
+            self.expires_at = float(os.getenv('UPWORK_ACCESS_TOKEN_EXPIRES_AT', '0').strip("'\""))
+        except ValueError:
+            self.expires_at = 0.0
     
     def refresh_access_token(self) -> Tuple[bool, str]:
-        """Refresh the access token using the refresh token."""
+        """
+        Refresh the access token using the refresh token.
+        
+        Concurrent callers share a single in-flight refresh instead of each
+        hitting the token endpoint (which would invalidate each other's
+        refresh tokens).
+        """
+        with self._refresh_lock:
+            inflight = self._refresh_inflight
+            if inflight is None:
+                self._refresh_inflight = future = Future()
+        
+        if inflight is not None:
+            return inflight.result()
+        
+        try:
+            result = self._refresh_access_token()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._refresh_lock:
+                self._refresh_inflight = None
+    
+    def _refresh_access_token(self) -> Tuple[bool, str]:
+        """Perform the token refresh request and store the new tokens."""
         if not all([self.client_id, self.client_secret, self.refresh_token]):
             return False, "Missing required credentials"
         
         try:
-            # Create Basic Auth header
-            auth_string = f"{self.client_id}:{self.client_secret}"
-            auth_bytes = auth_string.encode('ascii')
-            base64_auth = base64.b64encode(auth_bytes).decode('ascii')
-            
             # Prepare the request
             headers = {
                 'Content-Type': 'application/x-www-form-urlencoded',
-                'Authorization': f'Basic {base64_auth}'
+                'Authorization': self._basic_auth_header
             }
             
             data = {
@@ -49,7 +102,7 @@ class TokenManager:
             }
             
             # Make the request
-            response = requests.post(
+            response = _SESSION.post(
                 'https://www.upwork.com/api/v3/oauth2/token',
                 headers=headers,
                 data=data,
@@ -57,23 +110,32 @@ class TokenManager:
             )
             
             if response.status_code == 200:
-                token_data = response.json()
+                token_data = orjson.loads(response.content)
                 self.token_info = token_data
+                self.access_token = token_data['access_token']
+                self.expires_at = time.time() + float(token_data.get('expires_in', 3600))
                 
-                # Update the .env file with new tokens
-                set_key(
-                    self.env_path,
-                    'UPWORK_ACCESS_TOKEN',
-                    f"'{token_data['access_token']}'"
-                )
+                updates = {
+                    'UPWORK_ACCESS_TOKEN': token_data['access_token'],
+                    'UPWORK_ACCESS_TOKEN_EXPIRES_AT': f"{self.expires_at:.0f}",
+                }
                 
                 # Only update refresh token if a new one is provided
                 if 'refresh_token' in token_data:
-                    set_key(
-                        self.env_path,
-                        'UPWORK_ACCESS_TOKEN_REFRESH',
-                        f"'{token_data['refresh_token']}'"
+                    self.refresh_token = token_data['refresh_token']
+                    updates['UPWORK_ACCESS_TOKEN_REFRESH'] = token_data['refresh_token']
+                
+                # Update the .env file with new tokens in a single write. The old
+                # refresh token is spent either way, so a failed write must not
+                # turn the successful refresh into a failure
+                try:
+                    update_env_file(self.env_path, updates)
+                except OSError as e:
+                    logger.warning(
+                        "Token refreshed but saving it to %s failed: %s; "
+                        "the new tokens will be lost on restart", self.env_path, e
                     )
+                    return True, f"Token refreshed, but saving it to {self.env_path} failed: {e}"
                 
                 return True, "Token refreshed successfully"
             
@@ -82,12 +144,32 @@ class TokenManager:
         except Exception as e:
             return False, f"Error refreshing token: {str(e)}"
     
+    def token_expiring(self, now: Optional[float] = None) -> bool:
+        """Check whether the access token expires within EXPIRY_SKEW seconds.
+        
+        A token with an unknown expiry time counts as expiring.
+        """
+        return self.expires_at - (time.time() if now is None else now) <= self.EXPIRY_SKEW
+    
+    def refresh_if_expiring(self) -> Optional[Tuple[bool, str]]:
+        """Refresh the access token if it is about to expire.
+        
+        Failed refreshes are not retried for REFRESH_RETRY_DELAY seconds.
+        
+        Returns:
+            The refresh result, or None if no refresh was attempted
+        """
+        now = time.time()
+        if not self.token_expiring(now) or now - self._last_refresh_attempt < self.REFRESH_RETRY_DELAY:
+            return None
+        self._last_refresh_attempt = now
+        return self.refresh_access_token()
+    
     def get_access_token(self) -> str:
-        """Get the current access token, refreshing if necessary."""
-        # For now, just return the current token
-        # In a real implementation, you'd check if the token is expired
+        """Get the current access token."""
         return self.access_token
 
+@lru_cache(maxsize=1)
 def get_token_manager() -> TokenManager:
-    """Get a configured token manager instance."""
+    """Get the shared token manager, loading the credentials on first use."""
     return TokenManager()
@@ -0,0 +1,121 @@
+"""Shared pytest configuration and fixtures."""
+import threading
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+ENV_PATH = Path(__file__).parent.parent / ".env"
+
+
+@lru_cache(maxsize=1)
+def load_test_env(path: Path = ENV_PATH) -> None:
+    """Load the .env file into the environment once, without overriding set variables."""
+    load_dotenv(path, override=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _env() -> None:
+    """Load environment variables from .env once per test session."""
+    load_test_env()
+
+
+class FakeResponse:
+    """Minimal stand-in for ``requests.Response`` with the fields the client reads."""
+    
+    __slots__ = ("status_code", "content", "error")
+    
+    def __init__(self, status_code: int = 200, content: bytes = b"{}", error: Exception = None):
+        self.status_code = status_code
+        self.content = content
+        self.error = error
+    
+    @property
+    def text(self) -> str:
+        return self.content.decode()
+    
+    def raise_for_status(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+
+class FakeSession:
+    """Stand-in for ``requests.Session`` that records ``post`` calls.
+    
+    ``post`` returns queued ``responses`` first, then the default ``response``.
+    """
+    
+    def __init__(self, response: FakeResponse):
+        self.response = response
+        self.responses = []
+        self.calls = []
+    
+    def post(self, *args, **kwargs) -> FakeResponse:
+        self.calls.append((args, kwargs))
+        if self.responses:
+            return self.responses.pop(0)
+        return self.response
+
+
+@pytest.fixture
+def mock_session():
+    """Fake requests session whose post() returns a 200 response with an empty JSON body."""
+    mock_response = FakeResponse()
+    return FakeSession(mock_response), mock_response
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    """Answer every POST with the server's response body over keep-alive connections."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self) -> None:
+        self.server.requests.append(self.rfile.read(int(self.headers["Content-Length"])))
+        body = self.server.response_body
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """HTTP server on localhost that records POST bodies in ``requests``.
+    
+    Responds with ``response_body`` (an empty JSON object by default); the
+    base URL is available as ``url``.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RecordingHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.response_body = b"{}"
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _block_network(request, monkeypatch):
+    """Fail outgoing requests HTTP calls unless the test is marked ``network``.
+    
+    Catches requests that slip past the mocks, such as token refreshes,
+    at the transport adapter instead of letting them open sockets.
+    """
+    if request.node.get_closest_marker("network"):
+        return
+    
+    def send(self, request, *args, **kwargs):
+        raise requests.ConnectionError(f"Network access disabled in tests: {request.url}")
+    
+    monkeypatch.setattr(HTTPAdapter, "send", send)
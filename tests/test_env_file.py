@@ -0,0 +1,72 @@
+"""Tests for the .env file writer."""
+import os
+
+import pytest
+from dotenv import dotenv_values
+
+from src.utils.env_file import update_env_file
+
+ENV_CONTENT = """# Upwork credentials
+UPWORK_API_KEY=key
+export UPWORK_ACCESS_TOKEN="old-token"
+# UPWORK_ACCESS_TOKEN_REFRESH=commented-out
+UPWORK_ACCESS_TOKEN_REFRESH='old-refresh'
+"""
+
+
+@pytest.fixture
+def env_path(tmp_path):
+    """A .env file with comments, an export prefix and quoted values."""
+    path = tmp_path / ".env"
+    path.write_text(ENV_CONTENT)
+    return path
+
+
+def test_update_env_file_replaces_and_appends_keys(env_path):
+    """Test existing keys are rewritten in place and new keys appended."""
+    update_env_file(env_path, {
+        "UPWORK_ACCESS_TOKEN": "new-token",
+        "UPWORK_ACCESS_TOKEN_REFRESH": "new-refresh",
+        "UPWORK_ACCESS_TOKEN_EXPIRES_AT": "1700000000",
+    })
+
+    assert env_path.read_text() == (
+        "# Upwork credentials\n"
+        "UPWORK_API_KEY=key\n"
+        "export UPWORK_ACCESS_TOKEN='new-token'\n"
+        "# UPWORK_ACCESS_TOKEN_REFRESH=commented-out\n"
+        "UPWORK_ACCESS_TOKEN_REFRESH='new-refresh'\n"
+        "UPWORK_ACCESS_TOKEN_EXPIRES_AT='1700000000'\n"
+    )
+    assert not env_path.with_name(".env.tmp").exists()
+
+
+def test_update_env_file_quotes_values(env_path):
+    """Test values with quotes read back unchanged."""
+    update_env_file(env_path, {"UPWORK_ACCESS_TOKEN": "it's \"quoted\""})
+
+    assert dotenv_values(env_path)["UPWORK_ACCESS_TOKEN"] == "it's \"quoted\""
+
+
+def test_update_env_file_creates_missing_file(tmp_path):
+    """Test a missing .env file is created with owner-only permissions."""
+    path = tmp_path / ".env"
+    update_env_file(path, {"UPWORK_ACCESS_TOKEN": "token"})
+
+    assert path.read_text() == "UPWORK_ACCESS_TOKEN='token'\n"
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_update_env_file_is_atomic(env_path, monkeypatch):
+    """Test a failed write leaves the original file intact and no temp file behind."""
+    env_path.with_name(".env.tmp").write_text("leftover from a crash")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        update_env_file(env_path, {"UPWORK_ACCESS_TOKEN": "new-token"})
+
+    assert env_path.read_text() == ENV_CONTENT
+    assert not env_path.with_name(".env.tmp").exists()
@@ -1,7 +1,9 @@
 """Tests for the AI job analyzer module."""
 
+import asyncio
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from datetime import datetime
 
 from src.ai.job_analyzer import JobAnalyzer, JobAnalysis
@@ -129,6 +131,26 @@ class TestJobAnalyzer:
         assert "Hi there!" in script
         assert "High score" in reasoning
     
+    def test_parse_analysis_response_json(self):
+        """Test parsing a JSON-formatted AI response."""
+        with patch('src.ai.job_analyzer.OpenAI'), \
+             patch('src.ai.job_analyzer.settings'):
+            analyzer = JobAnalyzer()
+        
+        response = """{
+            "summary": "WordPress plugin development job.",
+            "score": 12,
+            "proposal_script": "Hi there! I build WordPress plugins.",
+            "reasoning": "Clear scope."
+        }"""
+        
+        summary, score, script, reasoning = analyzer._parse_analysis_response(response)
+        
+        assert summary == "WordPress plugin development job."
+        assert score == 10  # clamped to the 0-10 range
+        assert script == "Hi there! I build WordPress plugins."
+        assert reasoning == "Clear scope."
+    
     def test_parse_analysis_response_with_defaults(self):
         """Test parsing malformed AI response falls back to defaults."""
         with patch('src.ai.job_analyzer.OpenAI'), \
@@ -172,6 +194,20 @@ class TestJobAnalyzer:
         assert "25 reviews" in prompt
         assert "WordPress, PHP" in prompt
     
+    def test_build_analysis_prompt_truncates_description(self):
+        """Test long descriptions are truncated before prompting."""
+        with patch('src.ai.job_analyzer.OpenAI'), \
+             patch('src.ai.job_analyzer.settings'):
+            analyzer = JobAnalyzer()
+        
+        job = {"title": "Long Job", "description": "a" * 5000 + "TAIL"}
+        
+        prompt = analyzer._build_analysis_prompt(job)
+        
+        assert "a" * JobAnalyzer.MAX_DESCRIPTION_CHARS in prompt
+        assert "a" * (JobAnalyzer.MAX_DESCRIPTION_CHARS + 1) not in prompt
+        assert "TAIL" not in prompt
+    
     @patch('src.ai.job_analyzer.OpenAI')
     @patch('src.ai.job_analyzer.settings')
     def test_analyze_job_success(self, mock_settings, mock_openai):
@@ -232,4 +268,33 @@ class TestJobAnalyzer:
         
         result = analyzer.analyze_job(job)
         
-        assert result is None
\ No newline at end of file
+        assert result is None
+    
+    @patch('src.ai.job_analyzer.AsyncOpenAI')
+    @patch('src.ai.job_analyzer.OpenAI')
+    @patch('src.ai.job_analyzer.settings')
+    def test_analyze_jobs_batch(self, mock_settings, mock_openai, mock_async_openai):
+        """Test analyzing several jobs concurrently keeps input order and failures."""
+        mock_settings.OPENAI_API_KEY.get_secret_value.return_value = "test-key"
+        mock_client = Mock()
+        mock_async_openai.return_value = mock_client
+        
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "SUMMARY: Good job\nSCORE: 9"
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[mock_response, Exception("API Error")]
+        )
+        
+        analyzer = JobAnalyzer()
+        
+        jobs = [{"id": "job1", "title": "First"}, {"id": "job2", "title": "Second"}]
+        
+        results = asyncio.run(analyzer.analyze_jobs(jobs))
+        
+        assert len(results) == 2
+        assert results[0].job_id == "job1"
+        assert results[0].score == 9
+        assert results[1] is None
+        mock_async_openai.assert_called_once_with(api_key="test-key")
+        mock_openai.return_value.chat.completions.create.assert_not_called()
@@ -0,0 +1,39 @@
+"""Tests for the application entry point."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def test_import_main_without_credentials(tmp_path):
+    """Test importing main doesn't load settings, so it works without credentials."""
+    env = {key: value for key, value in os.environ.items()
+           if not key.startswith(("UPWORK_", "OPENAI_", "PUSHOVER_"))}
+    env["PYTHONPATH"] = str(PROJECT_ROOT)
+
+    result = subprocess.run(
+        [sys.executable, "-c", "import main"],
+        cwd=tmp_path, env=env, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_job_tracker_evicts_least_recently_seen(tmp_path, monkeypatch):
+    """Test an ID seen again just before eviction outlives older IDs, also after a reload."""
+    from main import JobTracker
+    monkeypatch.setattr(JobTracker, "MAX_SEEN_JOBS", 3)
+    
+    tracker = JobTracker(tmp_path)
+    for job_id in ("a", "b", "c"):
+        tracker.mark_job_seen(job_id)
+    tracker.mark_job_seen("a")
+    tracker.mark_job_seen("d")
+    tracker.close()
+    
+    assert list(tracker.seen_job_ids) == ["c", "a", "d"]
+    reloaded = JobTracker(tmp_path)
+    assert list(reloaded.seen_job_ids) == ["c", "a", "d"]
+    reloaded.close()
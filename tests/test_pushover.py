@@ -1,13 +1,218 @@
 #!/usr/bin/env python3
 """Test Pushover notification service."""
+import asyncio
 import os
 import sys
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import httpx
+import pytest
 from dotenv import load_dotenv
 
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.notifications.pushover import PushoverNotifier
+from src.notifications.pushover import (
+    ClientStats, NotificationWorker, PushoverNotifier, _clean_description, _parse_iso_datetime,
+    _shared_session,
+)
+
+JOB = {"id": "123", "title": "WordPress site fixes"}
+
+DETAILED_JOB = {
+    "id": "123",
+    "title": "WordPress site fixes",
+    "description": "<p>Fix  the theme &amp; plugins</p>",
+    "jobType": "HOURLY",
+    "hourlyBudgetMin": {"displayValue": "$30.00"},
+    "hourlyBudgetMax": {"displayValue": "$50.00"},
+    "totalApplicants": 5,
+    "client": {
+        "verificationStatus": "VERIFIED",
+        "totalFeedback": "4.87 of 5",
+        "totalHires": 3,
+        "totalPostedJobs": 4,
+        "totalSpent": {"displayValue": "$12,345.00"},
+    },
+}
+
+# (job budget fields, expected budget line); the last cases fall back to the title/description
+BUDGET_CASES = [
+    ({"hourlyBudget": {"min": 30.0, "max": 50.0}}, "💵 $30-50/hr"),
+    ({"hourlyBudget": {"min": 30.0}}, "💵 $30/hr"),
+    ({"budget": {"amount": 500}}, "💰 $500 (Fixed)"),
+    ({"hourlyBudgetMin": {"displayValue": "$25.00"}, "hourlyBudgetMax": {"displayValue": "$40.00"}},
+     "💵 $25-40/hr"),
+    ({"amount": {"displayValue": "$1,000"}}, "💰 $1,000 (Fixed)"),
+    ({"budgetRange": {"rangeStart": 100, "rangeEnd": 200}}, "💰 $100-200 (Fixed)"),
+    ({"budgetRange": {"min": 100}}, "💰 $100+ (Fixed)"),
+    ({"title": "Fix my site $40/hr"}, "💵 $40/hr"),
+    ({"description": "Budget $1,000 - $2,000"}, "💰 $1000-2000 (Fixed)"),
+    ({"title": "Fix my site"}, "💸 Rate: Not specified"),
+]
+
+@pytest.fixture
+def notifier():
+    """Configured notifier that retries without waiting."""
+    notifier = PushoverNotifier(api_token="token", user_key="user")
+    notifier.RETRY_BACKOFF = 0
+    return notifier
+
+def run_with_responses(statuses, coro_factory):
+    """Run a coroutine with Pushover answering each request with the next status code.
+    
+    Returns:
+        The coroutine's result and the number of requests made
+    """
+    statuses = list(statuses)
+    requests_made = []
+    
+    def handler(request):
+        requests_made.append(request)
+        return httpx.Response(statuses.pop(0) if len(statuses) > 1 else statuses[0], json={"status": 1})
+    
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with patch('src.notifications.pushover._shared_async_client', return_value=client):
+                return await coro_factory()
+    
+    return asyncio.run(run()), len(requests_made)
+
+@pytest.mark.parametrize("job, expected", BUDGET_CASES)
+def test_format_budget(notifier, job, expected):
+    """Test each budget format and the title/description fallback."""
+    assert notifier._format_budget(job) == expected
+
+def test_job_notification_compact_body(notifier):
+    """Test jobs without AI analysis are sent as compact plain text."""
+    notification = notifier._build_job_notification(DETAILED_JOB)
+    
+    assert notification["message"] == (
+        "job: WordPress site fixes\n"
+        "budget: 💵 $30-50/hr\n"
+        "type: ⏱️ Hourly\n"
+        "client: ✅ Verified client • ⭐ 4.9 • 📊 4 jobs • 👥 3 hires • 🎯 75% hire rate • 💳 $12K total spent\n"
+        "posted: 🕒 Just now\n"
+        "proposals: 5\n"
+        "\n"
+        "Fix the theme & plugins"
+    )
+    assert notification["title"] == "🚀 New Job Match!"
+    assert notification["url"] == "https://www.upwork.com/jobs/~02123"
+    assert "html" not in notification
+
+def test_client_stats_from_raw():
+    """Test client details are parsed once into ClientStats."""
+    assert ClientStats.from_raw(DETAILED_JOB["client"]) == ClientStats(
+        verified=True, rating=4.87, hires=3, posted=4, spent_display="$12,345.00"
+    )
+    assert ClientStats.from_raw({"totalFeedback": "n/a"}) == ClientStats(
+        verified=False, rating=None, hires=0, posted=0, spent_display=None
+    )
+
+@pytest.mark.parametrize("value", ["2024-03-05T07:08:09Z", "2024-03-05T07:08:09.123Z", "2024-03-05T07:08:09+02:00"])
+def test_parse_iso_datetime(value):
+    """Test the fast path for "Z" timestamps agrees with fromisoformat."""
+    assert _parse_iso_datetime(value) == datetime.fromisoformat(value.replace("Z", "+00:00"))
+    assert _parse_iso_datetime("2024-03-05T07:08:09Z").tzinfo == timezone.utc
+
+def test_clean_description():
+    """Test descriptions are stripped of HTML and truncated at a word boundary."""
+    assert _clean_description("Plain text") == "Plain text"
+    assert _clean_description("<p>Fix  the\ntheme &amp; plugins</p>") == "Fix the theme & plugins"
+    
+    truncated = _clean_description("word " * 60)
+    assert truncated == "word " * 49 + "word…"
+    assert len(truncated) <= 251
+
+def test_sync_session_retries_rate_limited_posts(notifier):
+    """Test the shared session retries POSTs answered with 429/5xx."""
+    retry = _shared_session().get_adapter(notifier.API_URL).max_retries
+    assert retry.is_retry("POST", 429)
+    assert retry.is_retry("POST", 503)
+    assert not retry.is_retry("POST", 400)
+
+def test_close_closes_shared_session(notifier):
+    """Test closing a notifier closes the shared session and later notifiers get a new one."""
+    session = notifier.session
+    with patch.object(session, "close", wraps=session.close) as close:
+        notifier.close()
+    close.assert_called_once()
+    
+    new_session = PushoverNotifier(api_token="token", user_key="user").session
+    assert new_session is not session
+    assert new_session is _shared_session()
+
+def test_asend_retries_rate_limited_requests(notifier):
+    """Test a 429 response is retried and the retry succeeds."""
+    sent, requests_made = run_with_responses(
+        [429, 200], lambda: notifier.asend_job_notification(JOB, retries=2)
+    )
+    assert sent is True
+    assert requests_made == 2
+
+def test_asend_gives_up_after_server_errors(notifier):
+    """Test a notification that keeps failing with 5xx responses reports failure."""
+    sent, requests_made = run_with_responses(
+        [503], lambda: notifier.asend_job_notification(JOB, retries=1)
+    )
+    assert sent is False
+    assert requests_made == 2
+
+def test_notification_worker_drops_when_queue_full(notifier):
+    """Test notifications submitted to a full queue are dropped."""
+    async def run():
+        worker = NotificationWorker(notifier, workers=1, maxsize=1)
+        worker.start()
+        queued = [worker.submit(JOB), worker.submit(JOB)]
+        await worker.stop()
+        return queued
+    
+    queued, requests_made = run_with_responses([200], run)
+    assert queued == [True, False]
+    assert requests_made == 1
+
+def test_notification_worker_stop_sends_queued(notifier):
+    """Test stop() sends every notification still in the queue."""
+    async def run():
+        worker = NotificationWorker(notifier, workers=2)
+        worker.start()
+        for job_id in range(5):
+            assert worker.submit({"id": str(job_id), "title": "Job"})
+        await worker.stop()
+        return worker.submit(JOB)
+    
+    submitted_after_stop, requests_made = run_with_responses([200], run)
+    assert requests_made == 5
+    assert submitted_after_stop is False
+
+def test_send_job_notifications_across_event_loops(local_server):
+    """Test async sends keep working when each batch runs on a new event loop."""
+    notifier = PushoverNotifier(api_token="token", user_key="user")
+    notifier.API_URL = f"{local_server.url}/1/messages.json"
+    
+    assert asyncio.run(notifier.send_job_notifications([(JOB, None)])) == [True]
+    assert asyncio.run(notifier.send_job_notifications([(JOB, None)])) == [True]
+    assert len(local_server.requests) == 2
+
+def test_notification_worker_closes_http_client(local_server):
+    """Test stopping the worker sends queued notifications and closes its HTTP client."""
+    from src.notifications import pushover
+    notifier = PushoverNotifier(api_token="token", user_key="user")
+    notifier.API_URL = f"{local_server.url}/1/messages.json"
+    
+    async def run():
+        worker = NotificationWorker(notifier)
+        worker.start()
+        assert worker.submit(JOB)
+        client = pushover._shared_async_client()
+        await worker.stop()
+        return client
+    
+    for _ in range(2):
+        assert asyncio.run(run()).is_closed
+    assert len(local_server.requests) == 2
 
 def main():
     """Test sending a Pushover notification."""
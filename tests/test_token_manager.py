@@ -0,0 +1,52 @@
+"""Tests for the Upwork token manager."""
+from unittest.mock import patch
+
+import orjson
+import pytest
+from dotenv import dotenv_values
+
+from src.utils.token_manager import TokenManager
+
+from conftest import FakeResponse
+
+TOKEN_RESPONSE = FakeResponse(content=orjson.dumps({
+    "access_token": "new-access",
+    "refresh_token": "new-refresh",
+    "expires_in": 3600,
+}))
+
+
+@pytest.fixture
+def token_manager(tmp_path):
+    """Token manager with credentials, saving tokens to a temporary .env file."""
+    manager = TokenManager(env_path=str(tmp_path / ".env"))
+    manager.client_id = "client-id"
+    manager.client_secret = "client-secret"
+    manager.refresh_token = "old-refresh"
+    manager.access_token = "old-access"
+    return manager
+
+
+def test_refresh_saves_new_tokens(token_manager):
+    """Test a successful refresh updates the tokens in memory and in .env."""
+    with patch("src.utils.token_manager._SESSION.post", return_value=TOKEN_RESPONSE):
+        success, _ = token_manager.refresh_access_token()
+
+    assert success is True
+    assert token_manager.access_token == "new-access"
+    saved = dotenv_values(token_manager.env_path)
+    assert saved["UPWORK_ACCESS_TOKEN"] == "new-access"
+    assert saved["UPWORK_ACCESS_TOKEN_REFRESH"] == "new-refresh"
+
+
+def test_refresh_succeeds_when_saving_fails(token_manager, caplog):
+    """Test a refresh whose .env write fails still reports success and uses the new tokens."""
+    with patch("src.utils.token_manager._SESSION.post", return_value=TOKEN_RESPONSE), \
+         patch("src.utils.token_manager.update_env_file", side_effect=OSError("read-only file system")):
+        success, message = token_manager.refresh_access_token()
+
+    assert success is True
+    assert "read-only file system" in message
+    assert token_manager.access_token == "new-access"
+    assert token_manager.refresh_token == "new-refresh"
+    assert "saving it to" in caplog.text
@@ -1,93 +1,187 @@
 """Tests for the Upwork GraphQL API client."""
+import asyncio
 import os
+import threading
+import time
 from unittest.mock import MagicMock, patch, ANY
 
+import httpx
+import orjson
 import pytest
-from dotenv import load_dotenv
+import requests
 
-from src.api.upwork_graphql import UpworkGraphQLClient, UpworkAuthenticationError, UpworkAPIError
+from config.settings import settings
+from src.api.upwork_graphql import (
+    JobDetailsLoader, UpworkGraphQLClient, UpworkAuthenticationError, UpworkAPIError,
+    _SEARCH_JOBS_QUERY, _query_body_prefix,
+)
 
-# Load environment variables for testing
-load_dotenv()
+from conftest import FakeResponse
+
+# Response bodies shared by tests, encoded once at import
+SEARCH_JOBS_SUCCESS_BODY = orjson.dumps({
+    "data": {
+        "marketplaceJobPostingsSearch": {
+            "edges": [
+                {
+                    "node": {
+                        "ciphertext": "test_cipher",
+                        "id": "test_job_id",
+                        "title": "Test Job",
+                        "description": "Test job description",
+                        "hourlyBudgetMin": {"displayValue": "$30.00"},
+                        "hourlyBudgetMax": {"displayValue": "$50.00"},
+                        "createdDateTime": "2023-01-01T00:00:00Z",
+                        "duration": "1 to 3 months",
+                        "experienceLevel": "Intermediate",
+                        "amount": {"displayValue": "$1000"},
+                        "client": {
+                            "totalReviews": 10,
+                            "totalFeedback": 5,
+                            "verificationStatus": "VERIFIED",
+                            "totalPostedJobs": 20,
+                            "totalHires": 15,
+                            "totalSpent": {"displayValue": "$5000"}
+                        },
+                        "totalApplicants": 5
+                    }
+                }
+            ]
+        }
+    }
+})
+
+JOB_DETAILS_SUCCESS_BODY = orjson.dumps({
+    "data": {
+        "job": {
+            "id": "test_job_id",
+            "title": "Test Job",
+            "description": "Test job description",
+            "createdDateTime": "2023-01-01T00:00:00Z",
+            "duration": "1 to 3 months",
+            "experienceLevel": "Intermediate",
+            "amount": {"displayValue": "$1000"},
+            "hourlyBudgetMin": {"displayValue": "$30.00"},
+            "hourlyBudgetMax": {"displayValue": "$50.00"},
+            "client": {
+                "totalReviews": 10,
+                "totalFeedback": 5,
+                "verificationStatus": "VERIFIED",
+                "totalPostedJobs": 20,
+                "totalHires": 15,
+                "totalSpent": {"displayValue": "$5000"}
+            },
+            "totalApplicants": 5,
+            "skills": [
+                {"name": "Python", "category": "Web Development"},
+                {"name": "Django", "category": "Web Development"}
+            ],
+            "category": {"name": "Web & Mobile Development"},
+            "subcategory": {"name": "Web Development"}
+        }
+    }
+})
+
+# (status code, response body, expected exception, expected result)
+ORGANIZATION_CASES = [
+    (200, {"data": {"organization": {"id": "test_org_id", "name": "Test Organization"}}},
+     None, {"id": "test_org_id", "name": "Test Organization"}),
+    (401, None, UpworkAuthenticationError, None),
+    (200, {"errors": [{"message": "Test error"}]}, UpworkAPIError, None),
+]
+
+# (status code, response body, raise_for_status error, expected exception)
+SEARCH_JOBS_CASES = [
+    (200, {"data": {"marketplaceJobPostingsSearch": {"edges": []}}}, None, None),
+    (200, {"errors": [{"message": "Test error"}]}, None, UpworkAPIError),
+    (500, None, Exception("Test HTTP error"), UpworkAPIError),
+]
 
 class TestUpworkGraphQLClient:
     """Test cases for the UpworkGraphQLClient class."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock for requests.Session."""
-        with patch('requests.Session') as mock_session_cls:
-            mock_session = MagicMock()
-            mock_session_cls.return_value = mock_session
-            mock_response = MagicMock()
-            mock_session.post.return_value = mock_response
-            yield mock_session, mock_response
+    @pytest.fixture(scope="module")
+    def _shared_client(self):
+        """Create one UpworkGraphQLClient with test settings for the whole module."""
+        return UpworkGraphQLClient()
 
     @pytest.fixture
-    def graphql_client(self, mock_session):
-        """Create an instance of UpworkGraphQLClient with test settings."""
-        client = UpworkGraphQLClient()
+    def graphql_client(self, _shared_client, mock_session):
+        """Hand out the shared client with a fresh mock session.
+
+        Attributes are restored and the caches emptied after each test, so
+        state such as the newest seen posting does not leak between tests.
+        """
+        client = _shared_client
+        state = dict(vars(client))
         # Replace the session with our mock
-        mock_session, _ = mock_session
-        client.session = mock_session
-        return client
+        client.session, _ = mock_session
+        yield client
+        vars(client).clear()
+        vars(client).update(state)
+        client._newest_created_at.clear()
+        client._registered_query_hashes.clear()
+        client._organization_cache.clear()
+        client._job_details_cache.clear()
 
-    def test_get_organization_success(self, graphql_client, mock_session):
-        """Test successful retrieval of organization information."""
-        # Get the mock session and response
+    @pytest.mark.parametrize(
+        "status_code, body, expected_error, expected_result",
+        ORGANIZATION_CASES,
+        ids=["success", "authentication_error", "api_error"],
+    )
+    def test_get_organization(self, graphql_client, mock_session,
+                              status_code, body, expected_error, expected_result):
+        """Test organization lookups for successful and failing responses."""
         _, mock_response = mock_session
+        mock_response.status_code = status_code
+        if body is not None:
+            mock_response.content = orjson.dumps(body)
         
-        # Mock successful response
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {
-                "organization": {
-                    "id": "test_org_id",
-                    "name": "Test Organization"
-                }
-            }
-        }
-
-        # Call the method
-        result = graphql_client.get_organization()
-
-        # Assertions
-        assert result == {"id": "test_org_id", "name": "Test Organization"}
-        graphql_client.session.post.assert_called_once()
+        if expected_error:
+            with pytest.raises(expected_error):
+                graphql_client.get_organization()
+        else:
+            assert graphql_client.get_organization() == expected_result
+        
+        assert len(graphql_client.session.calls) == 1
 
-    def test_authentication_error(self, graphql_client, mock_session):
-        """Test handling of authentication errors."""
-        # Get the mock response
-        _, mock_response = mock_session
+    def test_token_refreshed_only_near_expiry(self, graphql_client, monkeypatch):
+        """Test the access token is refreshed near expiry, once per failed attempt."""
+        token_manager = graphql_client.token_manager
+        refresh = MagicMock(return_value=(False, "Failed to refresh token"))
+        monkeypatch.setattr(token_manager, "refresh_access_token", refresh)
+        monkeypatch.setattr(token_manager, "_last_refresh_attempt", 0.0)
+        monkeypatch.setattr(token_manager, "expires_at", time.time() + 3600)
         
-        # Mock authentication error
-        mock_response.status_code = 401
+        graphql_client._ensure_valid_token()
+        refresh.assert_not_called()
+        
+        token_manager.expires_at = time.time() + 10
+        graphql_client._ensure_valid_token()
+        graphql_client._get_headers()
+        graphql_client._ensure_valid_token()
+        refresh.assert_called_once()
+
+    def test_clients_share_pooled_keep_alive_session(self):
+        """Test clients reuse one requests session with a sized connection pool."""
+        client = UpworkGraphQLClient()
 
-        # Assert that authentication error is raised
-        with pytest.raises(UpworkAuthenticationError):
-            graphql_client.get_organization()
-            
-        # Verify the session.post was called
-        graphql_client.session.post.assert_called_once()
+        assert isinstance(client.session, requests.Session)
+        assert UpworkGraphQLClient().session is client.session
+        adapter = client.session.get_adapter(client.endpoint)
+        assert adapter._pool_connections == settings.UPWORK_HTTP_POOL_CONNECTIONS
+        assert adapter._pool_maxsize == settings.UPWORK_HTTP_POOL_MAXSIZE
+        assert client._details_max_workers <= adapter._pool_maxsize
+        assert client._build_headers("token")["Connection"] == "keep-alive"
 
-    def test_api_error(self, graphql_client, mock_session):
-        """Test handling of API errors."""
-        # Get the mock response
+    def test_invalid_json_response_raises_api_error(self, graphql_client, mock_session):
+        """Test response bodies are parsed with orjson and bad JSON is reported."""
         _, mock_response = mock_session
+        mock_response.content = b"<html>Bad Gateway</html>"
         
-        # Mock API error
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "errors": [{"message": "Test error"}]
-        }
+        with pytest.raises(UpworkAPIError, match="Invalid JSON"):
+            graphql_client.search_jobs("test query")
 
-        # Assert that API error is raised
-        with pytest.raises(UpworkAPIError):
-            graphql_client.get_organization()
-            
-        # Verify the session.post was called
-        graphql_client.session.post.assert_called_once()
-        
     def test_search_jobs_success(self, graphql_client, mock_session):
         """Test successful job search."""
         # Get the mock response
@@ -95,37 +189,7 @@ class TestUpworkGraphQLClient:
         
         # Mock successful response
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {
-                "marketplaceJobPostingsSearch": {
-                    "edges": [
-                        {
-                            "node": {
-                                "ciphertext": "test_cipher",
-                                "id": "test_job_id",
-                                "title": "Test Job",
-                                "description": "Test job description",
-                                "hourlyBudgetMin": {"displayValue": "$30.00"},
-                                "hourlyBudgetMax": {"displayValue": "$50.00"},
-                                "createdDateTime": "2023-01-01T00:00:00Z",
-                                "duration": "1 to 3 months",
-                                "experienceLevel": "Intermediate",
-                                "amount": {"displayValue": "$1000"},
-                                "client": {
-                                    "totalReviews": 10,
-                                    "totalFeedback": 5,
-                                    "verificationStatus": "VERIFIED",
-                                    "totalPostedJobs": 20,
-                                    "totalHires": 15,
-                                    "totalSpent": {"displayValue": "$5000"}
-                                },
-                                "totalApplicants": 5
-                            }
-                        }
-                    ]
-                }
-            }
-        }
+        mock_response.content = SEARCH_JOBS_SUCCESS_BODY
         
         # Call the method
         result = graphql_client.search_jobs("test query")
@@ -134,13 +198,130 @@ class TestUpworkGraphQLClient:
         assert len(result) == 1
         assert result[0]["id"] == "test_job_id"
         assert result[0]["title"] == "Test Job"
-        graphql_client.session.post.assert_called_once()
+        assert len(graphql_client.session.calls) == 1
         
         # Verify the query and variables were passed correctly
-        call_args = graphql_client.session.post.call_args
+        call_args = graphql_client.session.calls[-1]
         assert call_args[0][0] == graphql_client.endpoint
-        assert call_args[1]["json"]["query"].strip().startswith("query SearchJobs")
-        assert call_args[1]["json"]["variables"]["filter"]["titleExpression"]["eq"] == "test query"
+        payload = orjson.loads(call_args[1]["data"])
+        assert payload["query"].strip().startswith("query SearchJobs")
+        assert payload["variables"]["filter"]["titleExpression"]["eq"] == "test query"
+        
+    def test_search_jobs_requests_only_newer_postings(self, graphql_client, mock_session):
+        """Test later searches only ask for postings newer than those already processed."""
+        _, mock_response = mock_session
+        
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({
+            "data": {
+                "marketplaceJobPostingsSearch": {
+                    "edges": [
+                        {"node": {"id": "newer", "createdDateTime": "2023-01-02T00:00:00Z"}},
+                        {"node": {"id": "older", "createdDateTime": "2023-01-01T00:00:00Z"}}
+                    ]
+                }
+            }
+        })
+        
+        def search_filter(*args):
+            graphql_client.search_jobs(*args)
+            return orjson.loads(graphql_client.session.calls[-1][1]["data"])["variables"]["filter"]
+        
+        jobs = graphql_client.search_jobs("test query")
+        # Until the jobs are processed, the next search asks for them again
+        assert "createdDateTime" not in search_filter("test query")
+        
+        graphql_client.advance_search_watermark(jobs, "test query")
+        assert search_filter("test query")["createdDateTime"] == {"rangeStart": "2023-01-02T00:00:00Z"}
+        assert orjson.loads(graphql_client.session.calls[-1][1]["data"])["variables"]["sortAttributes"] == [{"field": "RECENCY"}]
+        # Searches with other rate or budget filters keep their own watermark
+        assert "createdDateTime" not in search_filter("test query", 50)
+        
+    def test_search_jobs_uses_persisted_query_hash(self, graphql_client, mock_session):
+        """Test repeated searches send only the persisted query hash."""
+        _, mock_response = mock_session
+        
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"data": {"marketplaceJobPostingsSearch": {"edges": []}}})
+        
+        graphql_client.search_jobs("test query")
+        first = orjson.loads(graphql_client.session.calls[-1][1]["data"])
+        graphql_client.search_jobs("test query")
+        second = orjson.loads(graphql_client.session.calls[-1][1]["data"])
+        
+        assert first["query"].strip().startswith("query SearchJobs")
+        assert "query" not in second
+        assert second["extensions"]["persistedQuery"]["sha256Hash"] == first["extensions"]["persistedQuery"]["sha256Hash"]
+        
+    def test_search_jobs_reuses_pre_encoded_query(self, graphql_client, mock_session):
+        """Test full search queries are sent from a query body encoded only once."""
+        _, mock_response = mock_session
+        mock_response.content = orjson.dumps({"data": {"marketplaceJobPostingsSearch": {"edges": []}}})
+        graphql_client._persisted_queries_supported = False
+        
+        graphql_client.search_jobs("first query")
+        graphql_client.search_jobs("second query")
+        
+        first, second = (call[1]["data"] for call in graphql_client.session.calls)
+        prefix = _query_body_prefix(_SEARCH_JOBS_QUERY)
+        assert _query_body_prefix(_SEARCH_JOBS_QUERY) is prefix
+        assert first.startswith(prefix) and second.startswith(prefix)
+        assert orjson.loads(second)["variables"]["filter"]["titleExpression"]["eq"] == "second query"
+        
+    def test_search_jobs_falls_back_when_persisted_queries_unsupported(self, graphql_client, mock_session):
+        """Test searches send the full query once the server rejects a query hash."""
+        _, mock_response = mock_session
+        
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"data": {"marketplaceJobPostingsSearch": {"edges": []}}})
+        graphql_client.search_jobs("test query")
+        
+        unsupported = FakeResponse(content=orjson.dumps({"errors": [{"message": "Must provide query string"}]}))
+        graphql_client.session.responses = [unsupported]
+        
+        assert graphql_client.search_jobs("test query") == []
+        graphql_client.search_jobs("test query")
+        
+        payloads = [orjson.loads(c[1]["data"]) for c in graphql_client.session.calls[1:]]
+        assert "query" not in payloads[0]
+        assert payloads[1]["query"].strip().startswith("query SearchJobs")
+        assert payloads[2]["query"].strip().startswith("query SearchJobs")
+        assert "extensions" not in payloads[2]
+        
+    def test_search_jobs_falls_back_on_unknown_hash_rejection(self, graphql_client, mock_session):
+        """Test any GraphQL error on the first hash-only request falls back to full queries."""
+        _, mock_response = mock_session
+        mock_response.content = orjson.dumps({"data": {"marketplaceJobPostingsSearch": {"edges": []}}})
+        graphql_client.search_jobs("test query")
+        
+        rejected = FakeResponse(content=orjson.dumps({"errors": [{"message": "Unknown operation"}]}))
+        graphql_client.session.responses = [rejected]
+        
+        assert graphql_client.search_jobs("test query") == []
+        assert graphql_client._persisted_queries_supported is False
+        graphql_client.search_jobs("test query")
+        
+        payloads = [orjson.loads(c[1]["data"]) for c in graphql_client.session.calls[1:]]
+        assert "query" not in payloads[0]
+        assert payloads[1]["query"].strip().startswith("query SearchJobs")
+        assert "extensions" in payloads[1]
+        assert "extensions" not in payloads[2]
+        
+    def test_search_jobs_keeps_persisted_queries_after_transient_error(self, graphql_client, mock_session):
+        """Test a failed hash-only request doesn't turn persisted queries off."""
+        _, mock_response = mock_session
+        mock_response.content = orjson.dumps({"data": {"marketplaceJobPostingsSearch": {"edges": []}}})
+        graphql_client.search_jobs("test query")
+        
+        graphql_client.session.responses = [
+            FakeResponse(status_code=503, error=requests.HTTPError("503 Service Unavailable"))
+        ]
+        with pytest.raises(UpworkAPIError):
+            graphql_client.search_jobs("test query")
+        
+        assert graphql_client.search_jobs("test query") == []
+        assert graphql_client._persisted_queries_supported is True
+        assert "query" not in orjson.loads(graphql_client.session.calls[-1][1]["data"])
         
     def test_get_job_details_success(self, graphql_client, mock_session):
         """Test successful retrieval of job details."""
@@ -149,36 +330,7 @@ class TestUpworkGraphQLClient:
         
         # Mock successful response
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {
-                "job": {
-                    "id": "test_job_id",
-                    "title": "Test Job",
-                    "description": "Test job description",
-                    "createdDateTime": "2023-01-01T00:00:00Z",
-                    "duration": "1 to 3 months",
-                    "experienceLevel": "Intermediate",
-                    "amount": {"displayValue": "$1000"},
-                    "hourlyBudgetMin": {"displayValue": "$30.00"},
-                    "hourlyBudgetMax": {"displayValue": "$50.00"},
-                    "client": {
-                        "totalReviews": 10,
-                        "totalFeedback": 5,
-                        "verificationStatus": "VERIFIED",
-                        "totalPostedJobs": 20,
-                        "totalHires": 15,
-                        "totalSpent": {"displayValue": "$5000"}
-                    },
-                    "totalApplicants": 5,
-                    "skills": [
-                        {"name": "Python", "category": "Web Development"},
-                        {"name": "Django", "category": "Web Development"}
-                    ],
-                    "category": {"name": "Web & Mobile Development"},
-                    "subcategory": {"name": "Web Development"}
-                }
-            }
-        }
+        mock_response.content = JOB_DETAILS_SUCCESS_BODY
         
         # Call the method
         result = graphql_client.get_job_details("test_job_id")
@@ -188,54 +340,151 @@ class TestUpworkGraphQLClient:
         assert result["title"] == "Test Job"
         assert len(result["skills"]) == 2
         assert result["category"]["name"] == "Web & Mobile Development"
-        graphql_client.session.post.assert_called_once()
+        assert len(graphql_client.session.calls) == 1
         
         # Verify the query and variables were passed correctly
-        call_args = graphql_client.session.post.call_args
+        call_args = graphql_client.session.calls[-1]
         assert call_args[0][0] == graphql_client.endpoint
-        assert call_args[1]["json"]["query"].strip().startswith("query GetJobDetails")
-        assert call_args[1]["json"]["variables"]["id"] == "test_job_id"
+        payload = orjson.loads(call_args[1]["data"])
+        assert payload["query"].strip().startswith("query GetJobDetails")
+        assert payload["variables"]["id"] == "test_job_id"
         
-    def test_search_jobs_empty_response(self, graphql_client, mock_session):
-        """Test handling of empty response from the API."""
-        # Get the mock response
+    def test_get_job_details_cached(self, graphql_client, mock_session):
+        """Test repeated job detail lookups are served from the cache."""
         _, mock_response = mock_session
         
-        # Mock empty response
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": {"marketplaceJobPostingsSearch": {"edges": []}}}
+        mock_response.content = orjson.dumps({"data": {"job": {"id": "job1", "title": "First Job"}}})
         
-        # Call the method
-        result = graphql_client.search_jobs("test query")
+        first = graphql_client.get_job_details("job1")
+        second = graphql_client.get_job_details("job1")
         
-        # Assertions
-        assert result == []
-        graphql_client.session.post.assert_called_once()
+        assert first == second == {"id": "job1", "title": "First Job"}
+        assert len(graphql_client.session.calls) == 1
         
-    def test_search_jobs_api_error(self, graphql_client, mock_session):
-        """Test handling of API errors during job search."""
-        # Get the mock response
+        graphql_client._job_details_cache.clear()
+        graphql_client.get_job_details("job1")
+        assert len(graphql_client.session.calls) == 2
+        
+    def test_get_job_details_many_batches_requests(self, graphql_client, mock_session):
+        """Test several job detail lookups are sent in one batched request."""
         _, mock_response = mock_session
         
-        # Mock API error
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "errors": [{"message": "Test error"}]
-        }
+        mock_response.content = orjson.dumps([
+            {"data": {"job": {"id": "job1", "title": "First Job"}}},
+            {"data": {"job": None}, "errors": [{"message": "Not found"}]},
+        ])
         
-        # Assert that API error is raised
-        with pytest.raises(UpworkAPIError):
-            graphql_client.search_jobs("test query")
-            
-    def test_search_jobs_http_error(self, graphql_client, mock_session):
-        """Test handling of HTTP errors during job search."""
-        # Get the mock response
+        result = graphql_client.get_job_details_many(["job1", "job2"])
+        
+        assert result == [{"id": "job1", "title": "First Job"}, None]
+        assert len(graphql_client.session.calls) == 1
+        
+        payload = orjson.loads(graphql_client.session.calls[-1][1]["data"])
+        assert [op["variables"]["id"] for op in payload] == ["job1", "job2"]
+        assert all(op["query"].strip().startswith("query GetJobDetails") for op in payload)
+        
+    def test_get_job_details_many_sends_single_job_unbatched(self, graphql_client, mock_session):
+        """Test a lone job detail lookup is sent as a plain, non-array request."""
         _, mock_response = mock_session
         
-        # Mock HTTP error
-        mock_response.status_code = 500
-        mock_response.raise_for_status.side_effect = Exception("Test HTTP error")
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"data": {"job": {"id": "job1", "title": "First Job"}}})
         
-        # Call the method and expect an exception
-        with pytest.raises(UpworkAPIError):
-            graphql_client.search_jobs("test query")
+        result = graphql_client.get_job_details_many(["job1"])
+        
+        assert result == [{"id": "job1", "title": "First Job"}]
+        payload = orjson.loads(graphql_client.session.calls[-1][1]["data"])
+        assert payload["variables"]["id"] == "job1"
+        
+    def test_get_job_details_many_falls_back_to_concurrent_requests(self, graphql_client):
+        """Test job details are fetched one by one when batching is rejected."""
+        def get_job_details(job_id):
+            if job_id == "job1":
+                return {"id": "job1"}
+            raise UpworkAPIError("Not found")
+        
+        with patch.object(graphql_client, '_execute_batch', side_effect=UpworkAPIError("Batching not supported")), \
+             patch.object(graphql_client, 'get_job_details', side_effect=get_job_details):
+            result = graphql_client.get_job_details_many(["job1", "job2"])
+        
+        assert result == [{"id": "job1"}, None]
+        
+    def test_aget_job_details_many_runs_concurrently(self, graphql_client, monkeypatch):
+        """Test async job detail lookups over the shared httpx client."""
+        def handler(request):
+            job_id = orjson.loads(request.content)["variables"]["id"]
+            if job_id == "missing":
+                return httpx.Response(200, content=orjson.dumps({"data": {"job": None}}))
+            return httpx.Response(200, content=orjson.dumps({"data": {"job": {"id": job_id}}}))
+        
+        async def fetch():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                with patch('src.api.upwork_graphql._shared_async_client', return_value=client):
+                    return await graphql_client.aget_job_details_many(["job1", "missing", "job2"])
+        
+        monkeypatch.setattr(graphql_client.token_manager, "expires_at", time.time() + 3600)
+        result = asyncio.run(fetch())
+        
+        assert result == [{"id": "job1"}, None, {"id": "job2"}]
+        
+    def test_async_requests_across_event_loops(self, graphql_client, local_server, monkeypatch):
+        """Test async lookups work from separate asyncio.run calls with the real HTTP client."""
+        local_server.response_body = orjson.dumps({"data": {"job": {"id": "job1"}}})
+        graphql_client.endpoint = local_server.url
+        monkeypatch.setattr(graphql_client.token_manager, "expires_at", time.time() + 3600)
+        
+        assert asyncio.run(graphql_client.aget_job_details_many(["job1"])) == [{"id": "job1"}]
+        assert asyncio.run(graphql_client.aget_job_details_many(["job1"])) == [{"id": "job1"}]
+        assert len(local_server.requests) == 2
+        
+    def test_job_details_loader_batches_lookups(self, graphql_client):
+        """Test lookups made together are sent as a single batch."""
+        release = threading.Event()
+        
+        def get_job_details_many(job_ids):
+            release.wait(5)
+            return [{"id": job_id} if job_id != "missing" else None for job_id in job_ids]
+        
+        loader = JobDetailsLoader(graphql_client)
+        
+        async def load():
+            lookups = asyncio.gather(
+                loader.load("job1"), loader.load("missing"), loader.load("job1"), loader.load("job2")
+            )
+            await asyncio.sleep(loader.batch_window * 2)
+            # The batch's task is referenced by the loader while it runs
+            assert len(loader._tasks) == 1
+            release.set()
+            return await lookups
+        
+        with patch.object(graphql_client, 'get_job_details_many', side_effect=get_job_details_many) as many:
+            result = asyncio.run(load())
+        
+        assert result == [{"id": "job1"}, None, {"id": "job1"}, {"id": "job2"}]
+        many.assert_called_once_with(["job1", "missing", "job2"])
+        assert not loader._tasks
+        
+    @pytest.mark.parametrize(
+        "status_code, body, http_error, expected_error",
+        SEARCH_JOBS_CASES,
+        ids=["empty_response", "api_error", "http_error"],
+    )
+    def test_search_jobs_responses(self, graphql_client, mock_session,
+                                   status_code, body, http_error, expected_error):
+        """Test job searches for empty and failing responses."""
+        _, mock_response = mock_session
+        mock_response.status_code = status_code
+        if body is not None:
+            mock_response.content = orjson.dumps(body)
+        if http_error:
+            mock_response.error = http_error
+        
+        if expected_error:
+            with pytest.raises(expected_error):
+                graphql_client.search_jobs("test query")
+        else:
+            assert graphql_client.search_jobs("test query") == []
+            assert len(graphql_client.session.calls) == 1
+